@@ -14,13 +14,16 @@ HankookTire SmartSensor 2.0 - Database Performance Optimizer
 
 import asyncio
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql, errors
+from psycopg2.extras import RealDictCursor, Json, execute_batch
 import redis
 import json
+import orjson
 import logging
 import time
+import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import statistics
@@ -34,6 +37,8 @@ POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'smarttire_sensors')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'smarttire')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'password')
+# 같은 호스트의 PostgreSQL은 UNIX 도메인 소켓으로 연결
+POSTGRES_SOCKET_DIR = os.getenv('POSTGRES_SOCKET_DIR', '/var/run/postgresql')
 
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
@@ -44,6 +49,58 @@ SLOW_QUERY_THRESHOLD = float(os.getenv('SLOW_QUERY_THRESHOLD', '1.0'))  # 1초
 INDEX_USAGE_THRESHOLD = float(os.getenv('INDEX_USAGE_THRESHOLD', '0.1'))  # 10%
 CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '300'))  # 5분
 PARTITION_SIZE_MB = int(os.getenv('PARTITION_SIZE_MB', '1000'))  # 1GB
+VACUUM_LOCK_TIMEOUT = os.getenv('VACUUM_LOCK_TIMEOUT', '30s')
+VACUUM_STATEMENT_TIMEOUT = os.getenv('VACUUM_STATEMENT_TIMEOUT', '600s')
+VACUUM_MAX_ATTEMPTS = max(1, int(os.getenv('VACUUM_MAX_ATTEMPTS', '3')))
+
+# 정기 VACUUM 대상 테이블과 INDEX_CLEANUP 옵션
+# (append-only 테이블은 AUTO로 dead tuple이 적으면 인덱스 스캔 생략, PostgreSQL 14+ / 이전 버전은 ON)
+MAINTENANCE_TABLES = {
+    'sensors.sensor_readings': 'AUTO',
+    'sensors.tpms_data': 'ON',
+    'alerts.alert_events': 'ON',
+    'auth.security_events': 'ON'
+}
+
+# 고빈도 변경 테이블의 autovacuum 임계값 (기본 scale_factor 20%/10%는 대용량 테이블에 너무 느슨함)
+AUTOVACUUM_SETTINGS = {
+    'sensors.sensor_readings': {
+        'autovacuum_vacuum_scale_factor': 0.02,
+        'autovacuum_analyze_scale_factor': 0.01,
+        'autovacuum_vacuum_cost_limit': 2000,
+        'autovacuum_vacuum_insert_scale_factor': 0.05  # PostgreSQL 13+
+    },
+    'sensors.tpms_data': {
+        'autovacuum_vacuum_scale_factor': 0.02,
+        'autovacuum_analyze_scale_factor': 0.01,
+        'autovacuum_vacuum_cost_limit': 2000
+    },
+    'alerts.alert_events': {
+        'autovacuum_vacuum_scale_factor': 0.05,
+        'autovacuum_analyze_scale_factor': 0.02
+    }
+}
+
+VACUUM_STATS_SQL = """
+    SELECT schemaname || '.' || relname AS table_name, last_vacuum, last_analyze
+    FROM pg_stat_user_tables
+    WHERE schemaname || '.' || relname = ANY(%s)
+"""
+
+STALE_STATISTICS_SQL = """
+    SELECT schemaname, relname
+    FROM pg_stat_user_tables
+    WHERE (last_analyze IS NULL OR last_analyze < now() - interval '1 day')
+      AND (last_autoanalyze IS NULL OR last_autoanalyze < now() - interval '1 day')
+      AND n_mod_since_analyze > 1000
+      AND schemaname || '.' || relname <> ALL(%s)
+"""
+
+OPTIMIZATION_HISTORY_INSERT_SQL = """
+    INSERT INTO performance.optimization_history 
+    (optimization_type, target_object, action_taken, before_metrics, after_metrics, performance_gain)
+    VALUES ($1::text, $2::text, $3::text, $4::jsonb, $5::jsonb, $6::float8)
+"""
 
 # 로깅 설정
 logging.basicConfig(
@@ -52,6 +109,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _orjson_dumps(obj: Any) -> str:
+    """psycopg2 Json 어댑터용 직렬화 함수"""
+    return orjson.dumps(obj, default=str).decode()
+
 class OptimizationType(Enum):
     """최적화 타입"""
     INDEX_CREATION = "index_creation"
@@ -106,6 +167,16 @@ class PartitionStrategy:
     retention_period: int
     expected_performance_gain: float
 
+class PreparedConnection(psycopg2.extensions.connection):
+    """세션에 PREPARE된 문장 이름을 추적하는 연결"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+class VacuumSkipped(Exception):
+    """SKIP_LOCKED VACUUM이 잠긴 테이블을 건너뜀 (PostgreSQL은 오류 없이 WARNING만 발생)"""
+
 class DatabaseOptimizer:
     """데이터베이스 최적화 관리자"""
     
@@ -114,6 +185,16 @@ class DatabaseOptimizer:
         self.connection_pool = None
         self.query_stats = {}
         self.optimization_history = []
+        self._pending_opt_records = []
+        self.server_version_num = 0
+        self._report_sql = None
+        # (테이블, SKIP_LOCKED 여부) -> VACUUM 문 (서버 버전 확인 후 조합)
+        self._vacuum_sql = None
+        self._db_oid = None
+        # 직렬화된 리포트 캐시 ((DB명, 분 단위 버킷) -> JSON bytes)
+        self._report_cache: Dict[Tuple[str, int], bytes] = {}
+        # 블로킹 psycopg2 호출을 이벤트 루프 밖에서 실행 (풀 최대 연결 수와 동일)
+        self.executor = ThreadPoolExecutor(max_workers=20)
         
     async def initialize(self):
         """초기화"""
@@ -128,21 +209,59 @@ class DatabaseOptimizer:
         # 연결 풀 초기화
         self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
             5, 20,  # min, max connections
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
             database=POSTGRES_DB,
             user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
+            password=POSTGRES_PASSWORD,
+            connection_factory=PreparedConnection,
+            **self._connection_params()
         )
         
+        # 서버 버전 확인 (pg_stat_statements 컬럼명이 PostgreSQL 13에서 변경됨)
+        # 및 현재 데이터베이스 OID 고정 (리포트 쿼리마다 카탈로그 조회 방지)
+        conn = self.get_connection()
+        try:
+            self.server_version_num = conn.server_version
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT oid::int FROM pg_database WHERE datname = current_database()")
+                self._db_oid = cursor.fetchone()[0]
+            conn.commit()
+        finally:
+            self.return_connection(conn)
+        self._report_sql = self._build_report_sql()
+        self._vacuum_sql = self._build_vacuum_sql()
+        
         # 성능 모니터링 테이블 생성
         await self.create_performance_tables()
         
         # 기본 최적화 실행
         await self.apply_baseline_optimizations()
         
+        # 테이블별 autovacuum 튜닝
+        await self.configure_autovacuum()
+        
         logger.info("✅ 데이터베이스 최적화 관리자 초기화 완료")
 
+    def _connection_params(self) -> Dict[str, Any]:
+        """연결 위치 파라미터 (로컬이면 UNIX 소켓, 원격이면 TCP keepalive 설정)"""
+        if POSTGRES_HOST in ('localhost', '127.0.0.1') and os.path.isdir(POSTGRES_SOCKET_DIR):
+            # TCP 루프백 및 SSL 핸드셰이크 생략
+            return {
+                'host': POSTGRES_SOCKET_DIR,
+                'port': POSTGRES_PORT,
+                'sslmode': 'disable'
+            }
+        
+        # 끊어진 TCP 소켓이 오래 남아 첫 요청 지연을 키우지 않도록 설정
+        return {
+            'host': POSTGRES_HOST,
+            'port': POSTGRES_PORT,
+            'keepalives': 1,
+            'keepalives_idle': 60,
+            'keepalives_interval': 10,
+            'keepalives_count': 3,
+            'tcp_user_timeout': 30000  # ms
+        }
+
     async def create_performance_tables(self):
         """성능 모니터링 테이블 생성"""
         conn = self.get_connection()
@@ -217,6 +336,7 @@ class DatabaseOptimizer:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_query_performance_timestamp ON performance.query_performance(timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_index_usage_table ON performance.index_usage_stats(schema_name, table_name)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_table_size_stats_table ON performance.table_size_stats(schema_name, table_name)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_optimization_history_timestamp ON performance.optimization_history(timestamp DESC)")
                 
             conn.commit()
             logger.info("✅ 성능 모니터링 테이블 생성 완료")
@@ -236,6 +356,40 @@ class DatabaseOptimizer:
         """연결 풀에 연결 반환"""
         self.connection_pool.putconn(conn)
 
+    def _stat_statements_columns(self) -> Dict[str, str]:
+        """pg_stat_statements 시간 컬럼명 (PostgreSQL 13+는 *_exec_time)"""
+        suffix = '_exec_time' if self.server_version_num >= 130000 else '_time'
+        return {name: f"{name}{suffix}" for name in ('total', 'mean', 'max', 'min', 'stddev')}
+
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """블로킹 DB 작업을 스레드풀에서 실행"""
+        return await asyncio.get_event_loop().run_in_executor(self.executor, func, *args)
+
+    def _fetch_all(self, query: str, params: Optional[tuple] = None,
+                   cursor_factory: Optional[type] = RealDictCursor) -> List[Any]:
+        """풀 연결 하나로 조회 쿼리 실행 (스레드풀에서 호출)"""
+        conn = self.get_connection()
+        # 조회 전용이므로 자동 커밋 모드로 실행해 BEGIN/COMMIT 왕복 생략
+        prev_autocommit = conn.autocommit
+        conn.autocommit = True
+        
+        try:
+            with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        finally:
+            conn.autocommit = prev_autocommit
+            self.return_connection(conn)
+
+    async def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
+        """조회 쿼리 비동기 실행"""
+        return await self._run_blocking(self._fetch_all, query, params)
+
+    async def fetch_value(self, query: str, params: Optional[tuple] = None) -> Any:
+        """단일 값 조회 (기본 튜플 커서로 행 dict 생성 생략)"""
+        rows = await self._run_blocking(self._fetch_all, query, params, None)
+        return rows[0][0] if rows else None
+
     async def apply_baseline_optimizations(self):
         """기본 최적화 적용"""
         logger.info("🔧 기본 최적화 적용 중...")
@@ -356,49 +510,44 @@ class DatabaseOptimizer:
         """쿼리 성능 분석"""
         logger.info(f"🔍 최근 {days}일간 쿼리 성능 분석 중...")
         
-        conn = self.get_connection()
+        cols = self._stat_statements_columns()
         
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                # 느린 쿼리 조회
-                cursor.execute("""
-                    SELECT 
-                        query,
-                        calls,
-                        total_time,
-                        mean_time,
-                        max_time,
-                        min_time,
-                        rows,
-                        shared_blks_hit,
-                        shared_blks_read,
-                        shared_blks_dirtied,
-                        temp_blks_read,
-                        temp_blks_written
-                    FROM pg_stat_statements 
-                    WHERE mean_time > %s
-                    ORDER BY total_time DESC
-                    LIMIT 50
-                """, (SLOW_QUERY_THRESHOLD * 1000,))  # 밀리초 변환
-                
-                slow_queries = cursor.fetchall()
-                
-                analyses = []
-                for query_stat in slow_queries:
-                    analysis = await self._analyze_single_query(query_stat)
-                    analyses.append(analysis)
-                
-                # 분석 결과 저장
-                await self._save_query_analyses(analyses)
-                
-                logger.info(f"✅ {len(analyses)}개 쿼리 분석 완료")
-                return analyses
-                
+            # 느린 쿼리 조회
+            slow_queries = await self.fetch_all(f"""
+                SELECT 
+                    query,
+                    calls,
+                    {cols['total']} AS total_time,
+                    {cols['mean']} AS mean_time,
+                    {cols['max']} AS max_time,
+                    {cols['min']} AS min_time,
+                    rows,
+                    shared_blks_hit,
+                    shared_blks_read,
+                    shared_blks_dirtied,
+                    temp_blks_read,
+                    temp_blks_written
+                FROM pg_stat_statements 
+                WHERE {cols['mean']} > %s
+                ORDER BY {cols['total']} DESC
+                LIMIT 50
+            """, (SLOW_QUERY_THRESHOLD * 1000,))  # 밀리초 변환
+            
+            analyses = []
+            for query_stat in slow_queries:
+                analysis = await self._analyze_single_query(query_stat)
+                analyses.append(analysis)
+            
+            # 분석 결과 저장
+            await self._save_query_analyses(analyses)
+            
+            logger.info(f"✅ {len(analyses)}개 쿼리 분석 완료")
+            return analyses
+        
         except Exception as e:
             logger.error(f"❌ 쿼리 성능 분석 실패: {str(e)}")
             return []
-        finally:
-            self.return_connection(conn)
 
     async def _analyze_single_query(self, query_stat: Dict) -> QueryAnalysis:
         """단일 쿼리 분석"""
@@ -610,6 +759,9 @@ class DatabaseOptimizer:
         finally:
             self.return_connection(conn)
         
+        await self._flush_optimization_records()
+        self.invalidate_report_cache()
+        
         return created_indexes
 
     async def implement_partitioning(self, strategy: PartitionStrategy) -> bool:
@@ -657,6 +809,7 @@ class DatabaseOptimizer:
             return False
         finally:
             self.return_connection(conn)
+            await self._flush_optimization_records()
 
     async def _create_range_partitions(self, cursor, strategy: PartitionStrategy):
         """범위 파티션 생성"""
@@ -768,165 +921,450 @@ class DatabaseOptimizer:
         finally:
             self.return_connection(conn)
 
-    async def run_maintenance_tasks(self):
-        """정기 유지보수 작업"""
-        logger.info("🧹 데이터베이스 유지보수 작업 실행 중...")
-        
+    def _execute_autocommit(self, statement: Union[str, sql.Composable],
+                            settings: Optional[Dict[str, Any]] = None) -> float:
+        """트랜잭션 밖에서 유지보수 명령 실행 후 소요 시간 반환 (스레드풀에서 호출)"""
+        return self._execute_autocommit_with_notices(statement, settings)[0]
+
+    def _execute_autocommit_with_notices(self, statement: Union[str, sql.Composable],
+                                         settings: Optional[Dict[str, Any]] = None) -> Tuple[float, str, List[str]]:
+        """트랜잭션 밖에서 유지보수 명령 실행 후 (소요 시간, 실제 실행된 SQL, 서버 NOTICE/WARNING) 반환"""
+        settings = settings or {}
         conn = self.get_connection()
+        # VACUUM은 트랜잭션 블록 안에서 실행할 수 없음
+        prev_autocommit = conn.autocommit
+        conn.autocommit = True
         
         try:
             with conn.cursor() as cursor:
-                # VACUUM ANALYZE 실행
-                tables_to_maintain = [
-                    'sensors.sensor_readings',
-                    'sensors.tpms_data',
-                    'alerts.alert_events',
-                    'auth.security_events'
-                ]
+                # 세션 설정은 명령 실행 후 되돌려 풀 연결에 남기지 않음
+                for name, value in settings.items():
+                    cursor.execute(sql.SQL("SET {} = %s").format(sql.Identifier(name)), (value,))
+                try:
+                    # notices는 최대 50건만 유지되므로 실행 전에 비움
+                    del conn.notices[:]
+                    start_time = time.time()
+                    cursor.execute(statement)
+                    execution_time = time.time() - start_time
+                    return execution_time, cursor.query.decode(), list(conn.notices)
+                finally:
+                    for name in settings:
+                        cursor.execute(sql.SQL("RESET {}").format(sql.Identifier(name)))
+        finally:
+            conn.autocommit = prev_autocommit
+            self.return_connection(conn)
+
+    async def configure_autovacuum(self):
+        """테이블별 autovacuum 임계값 설정 (정기 VACUUM 대신 작은 autovacuum을 자주 실행)"""
+        logger.info("⚙️ 테이블별 autovacuum 설정 중...")
+        
+        for table, params in AUTOVACUUM_SETTINGS.items():
+            if self.server_version_num < 130000:
+                params = {k: v for k, v in params.items() if k != 'autovacuum_vacuum_insert_scale_factor'}
+            
+            alter_sql = sql.SQL("ALTER TABLE {} SET ({})").format(
+                sql.Identifier(*table.split('.')),
+                sql.SQL(', ').join(
+                    sql.SQL("{} = {}").format(sql.SQL(name), sql.Literal(value))
+                    for name, value in params.items()
+                )
+            )
+            
+            try:
+                await self._run_blocking(self._execute_autocommit, alter_sql)
                 
-                for table in tables_to_maintain:
-                    try:
-                        start_time = time.time()
-                        cursor.execute(f"VACUUM ANALYZE {table}")
-                        execution_time = time.time() - start_time
-                        
-                        logger.info(f"✅ VACUUM ANALYZE 완료: {table} ({execution_time:.2f}초)")
-                        
-                        # 최적화 이력 기록
-                        await self._record_optimization(
-                            OptimizationType.VACUUM_ANALYZE,
-                            table,
-                            "VACUUM ANALYZE executed",
-                            {},
-                            {"execution_time": execution_time},
-                            5.0  # 5% 성능 향상 예상
-                        )
-                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ VACUUM ANALYZE 실패: {table} - {str(e)}")
+                await self._record_optimization(
+                    OptimizationType.VACUUM_ANALYZE,
+                    table,
+                    "Configured per-table autovacuum thresholds",
+                    {},
+                    params,
+                    0.0
+                )
                 
-                # 통계 정보 업데이트
-                cursor.execute("ANALYZE")
+                logger.info(f"✅ autovacuum 설정 완료: {table}")
+            
+            except Exception as e:
+                logger.warning(f"⚠️ autovacuum 설정 실패: {table} - {str(e)}")
+        
+        await self._flush_optimization_records()
+
+    async def _vacuum_one(self, table: str) -> Tuple[float, int, str]:
+        """단일 테이블 VACUUM ANALYZE 후 (소요 시간, 시도 횟수, 실행된 VACUUM 문) 반환 (잠금 경합 시 재시도)"""
+        # 유지보수 시간대에는 비용 기반 지연 없이 실행하되 잠금 대기 시간은 제한
+        settings = {
+            'vacuum_cost_delay': 0,
+            'lock_timeout': VACUUM_LOCK_TIMEOUT,
+            'statement_timeout': VACUUM_STATEMENT_TIMEOUT
+        }
+        
+        for attempt in range(1, VACUUM_MAX_ATTEMPTS + 1):
+            # 마지막 시도는 SKIP_LOCKED로 잠긴 테이블을 대기 없이 건너뜀 (PostgreSQL 12+)
+            skip_locked = attempt == VACUUM_MAX_ATTEMPTS
+            
+            try:
+                execution_time, statement, notices = await self._run_blocking(
+                    self._execute_autocommit_with_notices, self._vacuum_sql[(table, skip_locked)], settings
+                )
                 
-            conn.commit()
+                # SKIP_LOCKED 건너뜀은 오류가 아닌 테이블명을 포함한 WARNING으로만 보고됨
+                relname = table.split('.')[-1]
+                if skip_locked and any('WARNING' in notice and f'"{relname}"' in notice for notice in notices):
+                    raise VacuumSkipped(f"skipped (lock not available): {' '.join(n.strip() for n in notices)}")
+                
+                return execution_time, attempt, statement
             
+            # statement_timeout(QueryCanceled)은 재시도해도 다시 시간 초과되므로 즉시 실패 처리
+            except errors.LockNotAvailable as e:
+                if skip_locked:
+                    raise
+                
+                delay = random.uniform(5, 30)
+                logger.warning(f"⚠️ VACUUM 잠금 경합: {table} (시도 {attempt}/{VACUUM_MAX_ATTEMPTS}, "
+                               f"{delay:.1f}초 후 재시도) - {str(e)}")
+                await asyncio.sleep(delay)
+
+    async def run_maintenance_tasks(self):
+        """정기 유지보수 작업"""
+        logger.info("🧹 데이터베이스 유지보수 작업 실행 중...")
+        
+        try:
+            # 테이블별 VACUUM을 각각의 풀 연결에서 동시에 실행
+            tables = list(MAINTENANCE_TABLES)
+            results = await asyncio.gather(
+                *[self._vacuum_one(table) for table in tables],
+                return_exceptions=True
+            )
+            
+            vacuum_results = {}
+            for table, result in zip(tables, results):
+                if isinstance(result, VacuumSkipped):
+                    logger.warning(f"⚠️ VACUUM ANALYZE 건너뜀 (잠금 경합): {table} - {str(result)}")
+                elif isinstance(result, Exception):
+                    logger.warning(f"⚠️ VACUUM ANALYZE 실패: {table} - {str(result)}")
+                else:
+                    vacuum_results[table] = result
+                    logger.info(f"✅ VACUUM ANALYZE 완료: {table} ({result[0]:.2f}초, {result[1]}회 시도)")
+            
+            if vacuum_results:
+                # 테이블별 VACUUM 시각 조회
+                rows = await self.fetch_all(VACUUM_STATS_SQL, (list(vacuum_results),))
+                vacuum_stats = {row['table_name']: row for row in rows}
+                
+                # 최적화 이력 기록 (시도 횟수로 잠금 경합 추적, 버전별로 조합된 실제 VACUUM 문 기록)
+                for table, (execution_time, attempts, statement) in vacuum_results.items():
+                    stats = vacuum_stats.get(table, {})
+                    await self._record_optimization(
+                        OptimizationType.VACUUM_ANALYZE,
+                        table,
+                        f"{statement} executed",
+                        {},
+                        {
+                            "execution_time": execution_time,
+                            "attempts": attempts,
+                            "last_vacuum": str(stats.get('last_vacuum')),
+                            "last_analyze": str(stats.get('last_analyze'))
+                        },
+                        5.0  # 5% 성능 향상 예상
+                    )
+            
+            # 통계가 오래된 나머지 테이블만 ANALYZE (대상 테이블은 위에서 이미 분석됨)
+            stale_rows = await self.fetch_all(STALE_STATISTICS_SQL, (list(MAINTENANCE_TABLES),))
+            
+            if stale_rows:
+                analyze_sql = sql.SQL("ANALYZE {}").format(sql.SQL(', ').join(
+                    sql.Identifier(row['schemaname'], row['relname']) for row in stale_rows
+                ))
+                await self._run_blocking(self._execute_autocommit, analyze_sql)
+                logger.info(f"✅ 통계 갱신 완료: {len(stale_rows)}개 테이블")
+        
         except Exception as e:
             logger.error(f"❌ 유지보수 작업 실패: {str(e)}")
-            conn.rollback()
         finally:
-            self.return_connection(conn)
+            await self._flush_optimization_records()
+            self.invalidate_report_cache()
 
     async def _record_optimization(self, opt_type: OptimizationType, target: str, action: str,
                                  before_metrics: Dict, after_metrics: Dict, performance_gain: float):
-        """최적화 이력 기록"""
+        """최적화 이력 기록 (버퍼에 적재 후 _flush_optimization_records에서 일괄 저장)"""
+        self._pending_opt_records.append((
+            opt_type.value,
+            target,
+            action,
+            # 직렬화는 Json 어댑터가 INSERT 시점(스레드풀)에 수행
+            Json(before_metrics, dumps=_orjson_dumps),
+            Json(after_metrics, dumps=_orjson_dumps),
+            performance_gain
+        ))
+
+    def _prepare(self, conn, cursor, name: str, statement: str):
+        """연결당 한 번만 PREPARE (이후 EXECUTE는 파싱/플래닝 생략)"""
+        if name not in conn.prepared_statements:
+            cursor.execute(f"PREPARE {name} AS {statement}")
+            conn.prepared_statements.add(name)
+
+    def _insert_optimization_records(self, records: List[tuple]):
+        """최적화 이력 일괄 INSERT (스레드풀에서 호출)"""
         conn = self.get_connection()
         
         try:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO performance.optimization_history 
-                    (optimization_type, target_object, action_taken, before_metrics, after_metrics, performance_gain)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (
-                    opt_type.value,
-                    target,
-                    action,
-                    json.dumps(before_metrics),
-                    json.dumps(after_metrics),
-                    performance_gain
-                ))
+                self._prepare(conn, cursor, "opt_insert", OPTIMIZATION_HISTORY_INSERT_SQL)
+                execute_batch(cursor, "EXECUTE opt_insert (%s, %s, %s, %s, %s, %s)", records, page_size=500)
                 
             conn.commit()
             
-        except Exception as e:
-            logger.error(f"❌ 최적화 이력 기록 실패: {str(e)}")
+        except Exception:
             conn.rollback()
+            raise
         finally:
             self.return_connection(conn)
 
+    async def _flush_optimization_records(self):
+        """버퍼에 쌓인 최적화 이력을 한 번의 트랜잭션으로 저장"""
+        if not self._pending_opt_records:
+            return
+        
+        records, self._pending_opt_records = self._pending_opt_records, []
+        
+        try:
+            await self._run_blocking(self._insert_optimization_records, records)
+        
+        except Exception as e:
+            logger.error(f"❌ 최적화 이력 기록 실패: {str(e)}")
+
+    def _build_vacuum_sql(self) -> Dict[Tuple[str, bool], sql.Composed]:
+        """테이블별 VACUUM 문 조합 (PARALLEL은 PostgreSQL 13+, INDEX_CLEANUP AUTO는 14+)"""
+        options = ["ANALYZE"]
+        if self.server_version_num >= 130000:
+            options.append("PARALLEL 4")
+        
+        statements = {}
+        for table, index_cleanup in MAINTENANCE_TABLES.items():
+            if index_cleanup == 'AUTO' and self.server_version_num < 140000:
+                index_cleanup = 'ON'
+            
+            for skip_locked in (False, True):
+                table_options = options + [f"INDEX_CLEANUP {index_cleanup}"]
+                if skip_locked:
+                    table_options.append("SKIP_LOCKED")
+                
+                statements[(table, skip_locked)] = sql.SQL("VACUUM ({}) {}").format(
+                    sql.SQL(", ".join(table_options)),
+                    sql.Identifier(*table.split('.'))
+                )
+        return statements
+
+    def _build_report_sql(self) -> str:
+        """성능 리포트 쿼리 조합 (서버 버전 확인 후 initialize에서 한 번만 호출)"""
+        cols = self._stat_statements_columns()
+        db_oid = int(self._db_oid)
+        return f"""
+            SELECT json_build_object(
+                -- 데이터베이스 크기 정보
+                -- (테이블 크기는 애플리케이션 스키마로 한정해 시스템/TOAST 릴레이션 스캔 회피)
+                'database_size', json_build_object(
+                    'database_size', pg_size_pretty(pg_database_size({db_oid}::oid)),
+                    'tables_size', pg_size_pretty((
+                        SELECT sum(pg_total_relation_size(c.oid))
+                        FROM pg_class c
+                        JOIN pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname IN ('sensors', 'alerts', 'auth', 'performance')
+                          AND c.relkind = 'r'
+                    ))
+                ),
+                -- 상위 느린 쿼리
+                'slow_queries', (
+                    SELECT COALESCE(json_agg(s), '[]'::json)
+                    FROM (
+                        SELECT 
+                            queryid,
+                            query,
+                            calls,
+                            {cols['total']} AS total_time,
+                            {cols['mean']} AS mean_time,
+                            {cols['max']} AS max_time,
+                            {cols['stddev']} AS stddev_time,
+                            shared_blks_hit,
+                            shared_blks_read,
+                            ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2) AS cache_hit_pct,
+                            temp_blks_written
+                        FROM pg_stat_statements 
+                        WHERE dbid = {db_oid}
+                          AND calls >= 5
+                          -- query::varchar(50)로 잘라 긴 쿼리 텍스트의 TOAST 해제 회피
+                          AND NOT upper(query::varchar(50)) LIKE ANY (ARRAY[
+                              'DEALLOCATE%', 'SET %', 'RESET %', 'BEGIN%', 'COMMIT%', 'ROLLBACK%', 'SHOW%'
+                          ])
+                        ORDER BY {cols['total']} DESC 
+                        LIMIT 10
+                    ) s
+                ),
+                -- 총 시간 / 임시 파일 / 캐시 미스 기준 상위 쿼리 (한 번의 스캔에 윈도 함수로 순위 계산)
+                'query_hotspots', (
+                    SELECT COALESCE(json_agg(r), '[]'::json)
+                    FROM (
+                        SELECT *
+                        FROM (
+                            SELECT 
+                                queryid,
+                                query::varchar(200) AS query,
+                                calls,
+                                {cols['total']} AS total_time,
+                                temp_blks_written,
+                                shared_blks_read,
+                                ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2) AS cache_hit_pct,
+                                row_number() OVER (ORDER BY {cols['total']} DESC) AS total_time_rank,
+                                row_number() OVER (ORDER BY temp_blks_written DESC) AS temp_blks_rank,
+                                row_number() OVER (ORDER BY shared_blks_read DESC) AS cache_miss_rank
+                            FROM pg_stat_statements
+                            WHERE dbid = {db_oid}
+                              AND calls >= 5
+                        ) ranked
+                        WHERE total_time_rank <= 5
+                           OR (temp_blks_rank <= 5 AND temp_blks_written > 0)
+                           OR (cache_miss_rank <= 5 AND shared_blks_read > 0)
+                        ORDER BY total_time_rank
+                    ) r
+                ),
+                -- dead tuple 상위 테이블
+                'dead_tuples', (
+                    SELECT COALESCE(json_agg(d), '[]'::json)
+                    FROM (
+                        SELECT 
+                            schemaname,
+                            relname,
+                            n_dead_tup,
+                            n_live_tup,
+                            last_autovacuum
+                        FROM pg_stat_user_tables
+                        ORDER BY n_dead_tup DESC
+                        LIMIT 10
+                    ) d
+                ),
+                -- 인덱스 사용률
+                'index_usage', (
+                    SELECT COALESCE(json_agg(i), '[]'::json)
+                    FROM (
+                        SELECT 
+                            schemaname,
+                            tablename,
+                            indexname,
+                            idx_scan,
+                            idx_tup_read,
+                            idx_tup_fetch
+                        FROM pg_stat_user_indexes
+                        ORDER BY idx_scan DESC
+                        LIMIT 20
+                    ) i
+                ),
+                -- 최근 최적화 이력
+                'optimization_history', (
+                    SELECT COALESCE(json_agg(h), '[]'::json)
+                    FROM (
+                        SELECT 
+                            optimization_type,
+                            target_object,
+                            action_taken,
+                            performance_gain,
+                            timestamp
+                        FROM performance.optimization_history
+                        WHERE timestamp > now() - interval '7 days'
+                        ORDER BY timestamp DESC
+                        LIMIT 20
+                    ) h
+                )
+            ) AS report
+        """
+
     async def generate_performance_report(self) -> Dict[str, Any]:
         """성능 리포트 생성"""
         logger.info("📊 데이터베이스 성능 리포트 생성 중...")
         
+        try:
+            report = {
+                'generated_at': datetime.utcnow().isoformat(),
+                'database_size': {},
+                'query_performance': {},
+                'index_usage': {},
+                'optimization_history': [],
+                'recommendations': []
+            }
+            
+            # 모든 통계를 단일 쿼리(단일 스냅샷)로 조회
+            stats = await self.fetch_value(self._report_sql) or {}
+            
+            report['database_size'] = stats.get('database_size') or {}
+            report['query_performance']['slow_queries'] = stats.get('slow_queries', [])
+            report['query_performance']['query_hotspots'] = stats.get('query_hotspots', [])
+            report['query_performance']['dead_tuples'] = stats.get('dead_tuples', [])
+            report['index_usage'] = stats.get('index_usage', [])
+            report['optimization_history'] = stats.get('optimization_history', [])
+            
+            return report
+        
+        except Exception as e:
+            logger.error(f"❌ 성능 리포트 생성 실패: {str(e)}")
+            return {}
+
+    def _export_optimization_history(self, output_path: str, days: int) -> int:
+        """최적화 이력을 JSON Lines로 스트리밍 저장 (스레드풀에서 호출)"""
         conn = self.get_connection()
+        exported = 0
         
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                report = {
-                    'generated_at': datetime.utcnow().isoformat(),
-                    'database_size': {},
-                    'query_performance': {},
-                    'index_usage': {},
-                    'optimization_history': [],
-                    'recommendations': []
-                }
-                
-                # 데이터베이스 크기 정보
-                cursor.execute("""
-                    SELECT 
-                        pg_size_pretty(pg_database_size(current_database())) as database_size,
-                        pg_size_pretty(sum(pg_total_relation_size(c.oid))) as tables_size
-                    FROM pg_class c
-                    LEFT JOIN pg_namespace n ON n.oid = c.relnamespace
-                    WHERE n.nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-                      AND c.relkind = 'r'
-                """)
-                
-                size_info = cursor.fetchone()
-                report['database_size'] = dict(size_info) if size_info else {}
-                
-                # 상위 느린 쿼리
-                cursor.execute("""
-                    SELECT 
-                        query,
-                        calls,
-                        total_time,
-                        mean_time,
-                        max_time
-                    FROM pg_stat_statements 
-                    ORDER BY total_time DESC 
-                    LIMIT 10
-                """)
-                
-                slow_queries = cursor.fetchall()
-                report['query_performance']['slow_queries'] = [dict(q) for q in slow_queries]
-                
-                # 인덱스 사용률
-                cursor.execute("""
-                    SELECT 
-                        schemaname,
-                        tablename,
-                        indexname,
-                        idx_scan,
-                        idx_tup_read,
-                        idx_tup_fetch
-                    FROM pg_stat_user_indexes
-                    ORDER BY idx_scan DESC
-                    LIMIT 20
-                """)
-                
-                index_stats = cursor.fetchall()
-                report['index_usage'] = [dict(idx) for idx in index_stats]
-                
-                # 최근 최적화 이력
+            # 서버 사이드(named) 커서로 itersize 단위씩 받아 클라이언트 메모리에 전체 적재 방지
+            with conn.cursor(name='opt_hist_stream', cursor_factory=RealDictCursor) as cursor, \
+                    open(output_path, 'wb') as f:
+                cursor.itersize = 1000
                 cursor.execute("""
                     SELECT *
                     FROM performance.optimization_history
+                    WHERE timestamp > now() - make_interval(days => %s)
                     ORDER BY timestamp DESC
-                    LIMIT 20
-                """)
-                
-                optimization_history = cursor.fetchall()
-                report['optimization_history'] = [dict(opt) for opt in optimization_history]
-                
-                return report
+                """, (days,))
                 
-        except Exception as e:
-            logger.error(f"❌ 성능 리포트 생성 실패: {str(e)}")
-            return {}
+                for row in cursor:
+                    f.write(orjson.dumps(row, default=str))
+                    f.write(b'\n')
+                    exported += 1
+            
+            conn.commit()
+            return exported
+        
+        except Exception:
+            conn.rollback()
+            raise
         finally:
             self.return_connection(conn)
 
+    async def export_optimization_history(self, output_path: str, days: int = 30) -> int:
+        """최적화 이력 내보내기"""
+        exported = await self._run_blocking(self._export_optimization_history, output_path, days)
+        logger.info(f"📤 최적화 이력 {exported}건 내보내기 완료: {output_path}")
+        return exported
+
+    async def get_performance_report_json(self) -> bytes:
+        """직렬화된 성능 리포트 조회 (분 단위로 캐시)"""
+        cache_key = (POSTGRES_DB, int(time.time() // 60))
+        
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        report = await self.generate_performance_report()
+        payload = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        
+        # 생성 실패(빈 리포트)는 캐시하지 않음, 지난 버킷은 버림
+        if report:
+            self._report_cache = {cache_key: payload}
+        
+        return payload
+
+    def invalidate_report_cache(self):
+        """리포트 캐시 무효화 (인덱스 생성, 유지보수 등 상태 변경 후 호출)"""
+        self._report_cache.clear()
+
 async def main():
     """메인 실행 함수"""
     logger.info("🚀 HankookTire SmartSensor 2.0 데이터베이스 최적화 시작")
@@ -952,11 +1390,11 @@ async def main():
     await optimizer.run_maintenance_tasks()
     
     # 성능 리포트 생성
-    report = await optimizer.generate_performance_report()
+    report_json = await optimizer.get_performance_report_json()
     
     # 리포트 저장
-    with open('database_performance_report.json', 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    with open('database_performance_report.json', 'wb') as f:
+        f.write(report_json)
     
     logger.info("🎉 데이터베이스 최적화 완료!")
     logger.info("📄 상세 리포트: database_performance_report.json")
@@ -15,34 +15,63 @@ HankookTire SmartSensor 2.0 - Comprehensive Load Testing Suite
 import asyncio
 import aiohttp
 import time
-import json
+import gzip
 import logging
-import statistics
 import random
+import math
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple, Any, Callable, Awaitable
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import numpy as np
+import orjson
+import matplotlib
+matplotlib.use('Agg')  # 비대화형 백엔드 (GUI 불필요)
 import matplotlib.pyplot as plt
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.pool
 import redis
 import websockets
-import paho.mqtt.client as mqtt
-import threading
-import queue
+import aiomqtt
 import ssl
 import os
+import sys
+from contextlib import nullcontext
+from operator import attrgetter
+
+try:
+    import uvloop
+except ImportError:  # uvloop 미설치 환경에서는 기본 이벤트 루프 사용
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 환경에서는 NumPy 집계 사용
+    njit = None
 
 # 설정
 API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:8000')
 MQTT_HOST = os.getenv('MQTT_HOST', 'localhost')
 MQTT_PORT = int(os.getenv('MQTT_PORT', '1883'))
 WEBSOCKET_URL = os.getenv('WEBSOCKET_URL', 'ws://localhost:8000/ws')
+HTTP_LIMIT_PER_HOST = int(os.getenv('HTTP_LIMIT_PER_HOST', '256'))  # 최소값 (동시 사용자 수에 따라 확대)
+HTTP_DNS_CACHE_TTL = int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+HTTP_KEEPALIVE_TIMEOUT = int(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '60'))
+MQTT_PUBLISH_BATCH = int(os.getenv('MQTT_PUBLISH_BATCH', '50'))
+MQTT_MAX_INFLIGHT = int(os.getenv('MQTT_MAX_INFLIGHT', '1000'))
+PAYLOAD_POOL_SIZE = int(os.getenv('PAYLOAD_POOL_SIZE', '100000'))
+PAYLOAD_TEMPLATE_COUNT = int(os.getenv('PAYLOAD_TEMPLATE_COUNT', '10000'))
+
+# 사전 직렬화 템플릿 자리표시자
+VEHICLE_ID_PLACEHOLDER = "__VID__"
+TIMESTAMP_PLACEHOLDER = "__TS__"
+MONITOR_SHARD_CAPACITY = int(os.getenv('MONITOR_SHARD_CAPACITY', '4096'))
+
+# 결과 분석에 사용하는 응답 시간 분위수
+RESPONSE_TIME_QUANTILES = [0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]
 
 POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'localhost')
 POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
@@ -50,6 +79,20 @@ POSTGRES_DB = os.getenv('POSTGRES_DB', 'smarttire_sensors')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'smarttire')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'password')
 
+# 데이터베이스 스트레스 테스트 쿼리
+DB_STRESS_QUERIES = [
+    "SELECT COUNT(*) FROM sensors.devices",
+    "SELECT * FROM sensors.sensor_readings ORDER BY created_at DESC LIMIT 100",
+    "SELECT vehicle_id, COUNT(*) FROM sensors.sensor_readings GROUP BY vehicle_id LIMIT 50",
+    "SELECT AVG(pressure_kpa) FROM sensors.tpms_data WHERE created_at > NOW() - INTERVAL '1 hour'"
+]
+
+CHART_DPI = int(os.getenv('CHART_DPI', '120'))
+LOAD_SINE_PERIOD_SECONDS = float(os.getenv('LOAD_SINE_PERIOD_SECONDS', '60'))
+RUN_TESTS_CONCURRENTLY = os.getenv('RUN_TESTS_CONCURRENTLY', 'true').lower() == 'true'
+TEST_COOLDOWN_SECONDS = int(os.getenv('TEST_COOLDOWN_SECONDS', '10'))
+MAX_CONCURRENT_TESTS = int(os.getenv('MAX_CONCURRENT_TESTS', '4'))
+
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 
@@ -60,6 +103,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _fused_stats_numpy(response_times: np.ndarray, errors: np.ndarray) -> Tuple[float, float, float, int]:
+    """응답 시간 합계/최소/최대 및 오류 수 집계"""
+    return (
+        float(response_times.sum(dtype=np.float64)),
+        float(response_times.min()),
+        float(response_times.max()),
+        int(errors.sum())
+    )
+
+if njit is not None:
+    @njit(cache=True)
+    def fused_stats(response_times, errors):
+        """응답 시간 합계/최소/최대 및 오류 수를 한 번의 순회로 집계"""
+        total = 0.0
+        lowest = response_times[0]
+        highest = response_times[0]
+        error_count = 0
+        for i in range(response_times.shape[0]):
+            value = response_times[i]
+            total += value
+            if value < lowest:
+                lowest = value
+            if value > highest:
+                highest = value
+            error_count += errors[i]
+        return total, lowest, highest, error_count
+else:
+    fused_stats = _fused_stats_numpy
+
 class TestType(Enum):
     """테스트 타입"""
     API_LOAD = "api_load"
@@ -79,7 +151,7 @@ class LoadPattern(Enum):
     STEP = "step"
     SINE_WAVE = "sine_wave"
 
-@dataclass
+@dataclass(slots=True)
 class TestConfig:
     """테스트 설정"""
     test_type: TestType
@@ -92,7 +164,7 @@ class TestConfig:
     network_delay_ms: int = 0
     error_threshold: float = 0.05  # 5%
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """테스트 결과"""
     test_type: TestType
@@ -116,6 +188,30 @@ class TestResult:
     cache_hit_rate: float
     details: Dict[str, Any]
 
+# 요청이 하나도 기록되지 않은 테스트의 결과 원형
+EMPTY_TEST_RESULT = TestResult(
+    test_type=TestType.API_LOAD,
+    start_time=datetime.min,
+    end_time=datetime.min,
+    total_requests=0,
+    successful_requests=0,
+    failed_requests=0,
+    avg_response_time=0,
+    p50_response_time=0,
+    p95_response_time=0,
+    p99_response_time=0,
+    max_response_time=0,
+    min_response_time=0,
+    throughput_rps=0,
+    error_rate=0,
+    cpu_usage_percent=0,
+    memory_usage_mb=0,
+    network_io_mb=0,
+    database_connections=0,
+    cache_hit_rate=0,
+    details={}
+)
+
 class SensorDataGenerator:
     """센서 데이터 생성기"""
     
@@ -123,99 +219,225 @@ class SensorDataGenerator:
         self.vehicle_ids = [f"VH{str(i).zfill(6)}" for i in range(1, 10001)]  # 10,000 vehicles
         self.sensor_types = ["pressure", "temperature", "humidity", "vibration", "location"]
         
+        # 센서 값 풀 사전 생성 (메시지마다 난수를 뽑지 않고 인덱스로 순환)
+        self._rng = rng = np.random.default_rng()
+        n = PAYLOAD_POOL_SIZE
+        self._pool_size = n
+        self._cursor = 0
+        
+        self._tpms_numbers = rng.integers(1, 5, n).tolist()
+        self._tire_positions = rng.choice(["FL", "FR", "RL", "RR"], n).tolist()
+        self._pressures = rng.normal(250, 20, n).round(2).tolist()
+        self._tire_temperatures = rng.normal(35, 10, n).round(2).tolist()
+        self._battery_voltages = rng.normal(3.2, 0.3, n).round(2).tolist()
+        self._signal_strengths = rng.integers(-90, -29, n).tolist()
+        self._tpms_quality_scores = rng.integers(70, 101, n).tolist()
+        
+        self._humidities = rng.normal(60, 15, n).round(2).tolist()
+        self._ambient_temperatures = rng.normal(25, 8, n).round(2).tolist()
+        self._vibrations = rng.normal(0.5, 0.2, n).round(3).tolist()
+        self._road_conditions = rng.choice(["dry", "wet", "snow", "ice"], n).tolist()
+        self._latitudes = rng.uniform(33.0, 38.0, n).round(6).tolist()
+        self._longitudes = rng.uniform(126.0, 131.0, n).round(6).tolist()
+        self._altitudes = rng.integers(0, 501, n).tolist()
+        self._env_quality_scores = rng.integers(80, 101, n).tolist()
+        
+        # 타임스탬프 캐시 (1ms마다 갱신)
+        self._timestamp_value = ""
+        self._timestamp_refreshed = 0.0
+        
+        # 사전 직렬화된 TPMS JSON 템플릿 (전송 시 차량 ID와 타임스탬프만 치환)
+        self._tpms_templates = self._build_tpms_templates(PAYLOAD_TEMPLATE_COUNT)
+        self._template_cursor = 0
+
+    def _next_index(self) -> int:
+        """값 풀 인덱스 순환"""
+        i = self._cursor
+        self._cursor = (i + 1) % self._pool_size
+        return i
+
+    def _timestamp(self) -> str:
+        """캐시된 타임스탬프 반환 (1ms 단위로 갱신)"""
+        now = time.time()
+        if now - self._timestamp_refreshed > 0.001:
+            self._timestamp_value = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+            self._timestamp_refreshed = now
+        return self._timestamp_value
+
     def generate_tpms_data(self, vehicle_id: str) -> Dict:
         """TPMS 센서 데이터 생성"""
+        i = self._next_index()
         return {
             "vehicle_id": vehicle_id,
-            "sensor_id": f"TPMS_{vehicle_id}_{random.randint(1, 4)}",
-            "tire_position": random.choice(["FL", "FR", "RL", "RR"]),
-            "pressure_kpa": round(random.normalvariate(250, 20), 2),
-            "temperature_celsius": round(random.normalvariate(35, 10), 2),
-            "battery_voltage": round(random.normalvariate(3.2, 0.3), 2),
-            "signal_strength": random.randint(-90, -30),
-            "timestamp": datetime.utcnow().isoformat(),
-            "quality_score": random.randint(70, 100)
+            "sensor_id": f"TPMS_{vehicle_id}_{self._tpms_numbers[i]}",
+            "tire_position": self._tire_positions[i],
+            "pressure_kpa": self._pressures[i],
+            "temperature_celsius": self._tire_temperatures[i],
+            "battery_voltage": self._battery_voltages[i],
+            "signal_strength": self._signal_strengths[i],
+            "timestamp": self._timestamp(),
+            "quality_score": self._tpms_quality_scores[i]
         }
+
+    def _build_tpms_templates(self, count: int) -> List[bytes]:
+        """TPMS JSON 템플릿 생성"""
+        templates = []
+        for _ in range(count):
+            data = self.generate_tpms_data(VEHICLE_ID_PLACEHOLDER)
+            data["timestamp"] = TIMESTAMP_PLACEHOLDER
+            templates.append(orjson.dumps(data))
+        return templates
+
+    def generate_tpms_json(self, vehicle_id: str) -> bytes:
+        """직렬화된 TPMS 센서 데이터 생성"""
+        i = self._template_cursor
+        self._template_cursor = (i + 1) % len(self._tpms_templates)
+        return (
+            self._tpms_templates[i]
+            .replace(VEHICLE_ID_PLACEHOLDER.encode(), vehicle_id.encode())
+            .replace(TIMESTAMP_PLACEHOLDER.encode(), self._timestamp().encode())
+        )
     
     def generate_environmental_data(self, vehicle_id: str) -> Dict:
         """환경 센서 데이터 생성"""
+        i = self._next_index()
         return {
             "vehicle_id": vehicle_id,
             "sensor_id": f"ENV_{vehicle_id}",
-            "humidity_percent": round(random.normalvariate(60, 15), 2),
-            "ambient_temperature": round(random.normalvariate(25, 8), 2),
-            "vibration_g": round(random.normalvariate(0.5, 0.2), 3),
-            "road_condition": random.choice(["dry", "wet", "snow", "ice"]),
+            "humidity_percent": self._humidities[i],
+            "ambient_temperature": self._ambient_temperatures[i],
+            "vibration_g": self._vibrations[i],
+            "road_condition": self._road_conditions[i],
             "location": {
-                "latitude": round(random.uniform(33.0, 38.0), 6),
-                "longitude": round(random.uniform(126.0, 131.0), 6),
-                "altitude": random.randint(0, 500)
+                "latitude": self._latitudes[i],
+                "longitude": self._longitudes[i],
+                "altitude": self._altitudes[i]
             },
-            "timestamp": datetime.utcnow().isoformat(),
-            "quality_score": random.randint(80, 100)
+            "timestamp": self._timestamp(),
+            "quality_score": self._env_quality_scores[i]
         }
     
     def generate_batch_data(self, count: int) -> List[Dict]:
         """배치 데이터 생성"""
-        data = []
-        for _ in range(count):
-            vehicle_id = random.choice(self.vehicle_ids)
-            if random.random() < 0.7:  # 70% TPMS data
-                data.append(self.generate_tpms_data(vehicle_id))
-            else:  # 30% Environmental data
-                data.append(self.generate_environmental_data(vehicle_id))
-        return data
+        # 차량 인덱스와 데이터 종류를 한 번에 샘플링 (70% TPMS, 30% 환경 데이터)
+        vehicle_indices = self._rng.integers(0, len(self.vehicle_ids), size=count).tolist()
+        is_tpms = (self._rng.random(count) < 0.7).tolist()
+        
+        vehicle_ids = self.vehicle_ids
+        return [
+            self.generate_tpms_data(vehicle_ids[i]) if tpms
+            else self.generate_environmental_data(vehicle_ids[i])
+            for i, tpms in zip(vehicle_indices, is_tpms)
+        ]
+
+class MetricsShard:
+    """워커별 메트릭 버퍼"""
+
+    def __init__(self, capacity: int):
+        self.response_times = np.empty(capacity, dtype=np.float32)
+        self.timestamps = np.empty(capacity, dtype=np.float32)
+        self.errors = np.empty(capacity, dtype=np.uint8)
+        self.count = 0
+
+    def record(self, response_time: float, timestamp: float, error: int):
+        """샘플 기록"""
+        n = self.count
+        if n == len(self.response_times):
+            self._grow()
+        self.response_times[n] = response_time
+        self.timestamps[n] = timestamp
+        self.errors[n] = error
+        self.count = n + 1
+
+    def _grow(self):
+        """배열 용량 두 배 확장"""
+        n = self.count
+        for name in ('response_times', 'timestamps', 'errors'):
+            values = getattr(self, name)
+            grown = np.empty(n * 2, dtype=values.dtype)
+            grown[:n] = values
+            setattr(self, name, grown)
 
 class PerformanceMonitor:
     """성능 모니터링"""
     
     def __init__(self):
-        self.metrics = {
-            'response_times': [],
-            'timestamps': [],
-            'errors': [],
-            'throughput': []
-        }
+        self.shards: Dict[str, MetricsShard] = {}
         self.start_time = None
         
     def start_monitoring(self):
         """모니터링 시작"""
         self.start_time = time.time()
-        self.metrics = {
-            'response_times': [],
-            'timestamps': [],
-            'errors': [],
-            'throughput': []
-        }
+        self.shards = {}
+
+    def clear(self):
+        """기록된 샘플 해제"""
+        self.shards = {}
         
-    def record_request(self, response_time: float, success: bool):
-        """요청 기록"""
-        current_time = time.time()
-        self.metrics['response_times'].append(response_time)
-        self.metrics['timestamps'].append(current_time - self.start_time)
-        self.metrics['errors'].append(0 if success else 1)
+    def record_request(self, response_time: float, success: bool, worker_id: str = "main"):
+        """요청 기록 (워커별 버퍼에 기록하고 분석 시 병합)"""
+        shard = self.shards.get(worker_id)
+        if shard is None:
+            shard = self.shards[worker_id] = MetricsShard(MONITOR_SHARD_CAPACITY)
+        shard.record(response_time, time.time() - self.start_time, 0 if success else 1)
         
     def calculate_throughput(self, window_seconds: int = 10) -> float:
         """처리량 계산"""
-        current_time = time.time() - self.start_time
-        recent_requests = [
-            t for t in self.metrics['timestamps'] 
-            if t > current_time - window_seconds
-        ]
-        return len(recent_requests) / window_seconds if recent_requests else 0
+        threshold = time.time() - self.start_time - window_seconds
+        recent_requests = sum(
+            np.count_nonzero(shard.timestamps[:shard.count] > threshold)
+            for shard in self.shards.values()
+        )
+        return recent_requests / window_seconds
+
+    def _merge(self, name: str, dtype) -> np.ndarray:
+        """워커별 배열 병합"""
+        if not self.shards:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate([getattr(shard, name)[:shard.count] for shard in self.shards.values()])
+
+    def get_response_times(self) -> np.ndarray:
+        """기록된 응답 시간 배열 반환"""
+        return self._merge('response_times', np.float32)
+
+    def get_errors(self) -> np.ndarray:
+        """기록된 오류 플래그 배열 반환"""
+        return self._merge('errors', np.uint8)
 
 class LoadTestRunner:
     """부하 테스트 실행기"""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_users: int = 0):
         self.session = None
         self.monitor = PerformanceMonitor()
+        # 커넥터 한도가 측정 병목이 되지 않도록 최대 동시 사용자 수의 4배까지 연결 허용
+        self.connection_limit = max(HTTP_LIMIT_PER_HOST, max_concurrent_users * 4)
         self.data_generator = SensorDataGenerator()
         self.redis_client = None
+        self.pg_pool = None
+        self.db_executor = None
+        self.request_semaphore = None
         
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        
+        # 동시 HTTP 요청 수 제한 (커넥터의 호스트당 연결 한도와 동일)
+        self.request_semaphore = asyncio.Semaphore(self.connection_limit)
+        
+        # 연결 재사용 및 DNS 캐시 (기본 커넥터 한도 100개가 동시 사용자 수를 제한하지 않도록)
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.connection_limit,
+            use_dns_cache=True,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
         
         # Redis 연결
         self.redis_client = redis.Redis(
@@ -230,6 +452,13 @@ class LoadTestRunner:
         if self.session:
             await self.session.close()
 
+    @staticmethod
+    async def _discard_body(response: aiohttp.ClientResponse):
+        """응답 본문을 버퍼링/디코딩 없이 소비"""
+        # release()만 호출하면 남은 본문 때문에 연결이 닫히므로 끝까지 읽어 keepalive 유지
+        while await response.content.readany():
+            pass
+
     async def authenticate(self) -> str:
         """인증 토큰 획득"""
         try:
@@ -255,6 +484,7 @@ class LoadTestRunner:
         
         self.monitor.start_monitoring()
         start_time = datetime.utcnow()
+        config_details = asdict(config)
         
         # 인증 토큰 획득
         auth_token = ""
@@ -276,9 +506,9 @@ class LoadTestRunner:
         
         # 동시 요청 실행
         tasks = []
-        for _ in range(config.concurrent_users):
+        for i in range(config.concurrent_users):
             task = asyncio.create_task(
-                self._execute_api_requests(endpoints, headers, config.duration_seconds)
+                self._execute_api_requests(endpoints, headers, config, f"api_{i}")
             )
             tasks.append(task)
         
@@ -288,13 +518,38 @@ class LoadTestRunner:
         end_time = datetime.utcnow()
         
         # 결과 분석
-        return self._analyze_results(TestType.API_LOAD, start_time, end_time, config)
+        return self._analyze_results(TestType.API_LOAD, start_time, end_time, config_details)
 
-    async def _execute_api_requests(self, endpoints: List[Tuple[str, str]], headers: Dict, duration: int):
-        """API 요청 실행"""
-        end_time = time.time() + duration
+    @staticmethod
+    def _load_factor(load_pattern: LoadPattern, elapsed: float, duration: float) -> float:
+        """부하 패턴에 따른 목표 RPS 배율"""
+        progress = elapsed / duration if duration > 0 else 1.0
+        
+        if load_pattern == LoadPattern.RAMP_UP:
+            factor = progress
+        elif load_pattern == LoadPattern.SPIKE:
+            factor = 3.0 if 0.4 <= progress < 0.5 else 1.0
+        elif load_pattern == LoadPattern.STEP:
+            factor = min(1.0, 0.25 * (int(progress * 4) + 1))
+        elif load_pattern == LoadPattern.SINE_WAVE:
+            factor = 0.5 * (1 + math.sin(2 * math.pi * elapsed / LOAD_SINE_PERIOD_SECONDS))
+        else:
+            factor = 1.0
+        
+        return max(factor, 0.05)
+
+    async def _execute_api_requests(self, endpoints: List[Tuple[str, str]], headers: Dict, config: TestConfig, worker_id: str):
+        """API 요청 실행 (목표 RPS에 맞춘 요청 스케줄)"""
+        duration = config.duration_seconds
         
-        while time.time() < end_time:
+        # 워커당 기본 요청 간격 = 동시 사용자 수 / 목표 RPS
+        base_interval = config.concurrent_users / config.rps_target if config.rps_target > 0 else 0.0
+        
+        started = time.monotonic()
+        end_time = started + duration
+        next_request = started
+        
+        while time.monotonic() < end_time:
             endpoint, method = random.choice(endpoints)
             url = f"{API_BASE_URL}{endpoint}"
             
@@ -303,24 +558,29 @@ class LoadTestRunner:
             
             try:
                 if method == "GET":
-                    async with self.session.get(url, headers=headers) as response:
+                    async with self.request_semaphore, self.session.get(url, headers=headers) as response:
                         success = response.status < 400
-                        await response.text()  # 응답 본문 읽기
+                        await self._discard_body(response)  # 응답 본문 소비 (연결 재사용)
                 elif method == "POST":
-                    data = self.data_generator.generate_tpms_data("TEST_VEHICLE")
-                    async with self.session.post(url, json=data, headers=headers) as response:
+                    payload = self.data_generator.generate_tpms_json("TEST_VEHICLE")
+                    post_headers = {**headers, "Content-Type": "application/json"}
+                    async with self.request_semaphore, self.session.post(url, data=payload, headers=post_headers) as response:
                         success = response.status < 400
-                        await response.text()
+                        await self._discard_body(response)
                         
             except Exception as e:
                 logger.debug(f"요청 실패: {str(e)}")
                 success = False
             
             response_time = time.time() - start_request
-            self.monitor.record_request(response_time, success)
+            self.monitor.record_request(response_time, success, worker_id)
             
-            # 요청 간 간격 (목표 RPS 달성)
-            await asyncio.sleep(random.uniform(0.1, 0.5))
+            # 다음 요청 시각까지 대기 (응답 시간과 무관하게 목표 RPS 유지)
+            elapsed = time.monotonic() - started
+            next_request += base_interval / self._load_factor(config.load_pattern, elapsed, duration)
+            delay = next_request - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
 
     async def run_sensor_streaming_test(self, config: TestConfig) -> TestResult:
         """센서 스트리밍 테스트"""
@@ -328,68 +588,70 @@ class LoadTestRunner:
         
         self.monitor.start_monitoring()
         start_time = datetime.utcnow()
+        config_details = asdict(config)
         
-        # MQTT 클라이언트 설정
-        mqtt_results = queue.Queue()
-        mqtt_threads = []
-        
-        for i in range(config.concurrent_users):
-            thread = threading.Thread(
-                target=self._mqtt_sensor_simulation,
-                args=(f"sensor_{i}", config.duration_seconds, mqtt_results)
-            )
-            thread.start()
-            mqtt_threads.append(thread)
+        # MQTT 센서 시뮬레이션 (센서당 코루틴 하나)
+        mqtt_tasks = [
+            self._mqtt_sensor_simulation(f"sensor_{i}", config.duration_seconds)
+            for i in range(config.concurrent_users)
+        ]
         
-        # WebSocket 스트리밍 시뮬레이션
-        websocket_task = asyncio.create_task(
-            self._websocket_streaming_test(config.duration_seconds)
+        # WebSocket 스트리밍 시뮬레이션과 함께 실행
+        await asyncio.gather(
+            self._websocket_streaming_test(config.duration_seconds),
+            *mqtt_tasks,
+            return_exceptions=True
         )
         
-        # 모든 스레드 완료 대기
-        for thread in mqtt_threads:
-            thread.join()
-        
-        await websocket_task
-        
         end_time = datetime.utcnow()
         
-        return self._analyze_results(TestType.SENSOR_STREAMING, start_time, end_time, config)
+        return self._analyze_results(TestType.SENSOR_STREAMING, start_time, end_time, config_details)
 
-    def _mqtt_sensor_simulation(self, sensor_id: str, duration: int, results: queue.Queue):
+    async def _mqtt_sensor_simulation(self, sensor_id: str, duration: int) -> int:
         """MQTT 센서 시뮬레이션"""
+        message_count = 0
+        
         try:
-            client = mqtt.Client()
-            client.connect(MQTT_HOST, MQTT_PORT, 60)
-            client.loop_start()
-            
-            end_time = time.time() + duration
-            message_count = 0
-            
-            while time.time() < end_time:
-                # 센서 데이터 생성 및 전송
-                data = self.data_generator.generate_tpms_data(f"VEHICLE_{sensor_id}")
+            async with aiomqtt.Client(
+                MQTT_HOST,
+                MQTT_PORT,
+                keepalive=60,
+                max_inflight_messages=MQTT_MAX_INFLIGHT
+            ) as client:
+                end_time = time.time() + duration
                 topic = f"sensors/tpms/{sensor_id}"
+                vehicle_id = f"VEHICLE_{sensor_id}"
                 
-                start_time = time.time()
-                result = client.publish(topic, json.dumps(data))
-                
-                if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                    response_time = time.time() - start_time
-                    self.monitor.record_request(response_time, True)
-                    message_count += 1
-                else:
-                    self.monitor.record_request(0, False)
-                
-                time.sleep(random.uniform(0.5, 2.0))  # 센서 데이터 전송 간격
-            
-            client.loop_stop()
-            client.disconnect()
-            results.put(message_count)
-            
+                while time.time() < end_time:
+                    # 직렬화된 센서 데이터 배치 생성 후 연속 전송
+                    batch = [
+                        self.data_generator.generate_tpms_json(vehicle_id)
+                        for _ in range(MQTT_PUBLISH_BATCH)
+                    ]
+                    
+                    start_time = time.time()
+                    outcomes = []
+                    for payload in batch:
+                        try:
+                            await client.publish(topic, payload)
+                            outcomes.append(True)
+                        except aiomqtt.MqttError:
+                            outcomes.append(False)
+                    response_time = (time.time() - start_time) / len(batch)
+                    
+                    for success in outcomes:
+                        if success:
+                            self.monitor.record_request(response_time, True, sensor_id)
+                            message_count += 1
+                        else:
+                            self.monitor.record_request(0, False, sensor_id)
+                    
+                    await asyncio.sleep(random.uniform(0.5, 2.0))  # 배치 전송 간격
+        
         except Exception as e:
             logger.error(f"MQTT 시뮬레이션 오류: {str(e)}")
-            results.put(0)
+        
+        return message_count
 
     async def _websocket_streaming_test(self, duration: int):
         """WebSocket 스트리밍 테스트"""
@@ -397,23 +659,23 @@ class LoadTestRunner:
             async with websockets.connect(WEBSOCKET_URL) as websocket:
                 end_time = time.time() + duration
                 
+                # 실시간 데이터 요청 (매 반복 동일하므로 한 번만 직렬화)
+                request = orjson.dumps({
+                    "type": "subscribe",
+                    "topic": "realtime_dashboard",
+                    "filters": {"vehicle_count": 100}
+                }).decode()
+                
                 while time.time() < end_time:
-                    # 실시간 데이터 요청
-                    request = {
-                        "type": "subscribe",
-                        "topic": "realtime_dashboard",
-                        "filters": {"vehicle_count": 100}
-                    }
-                    
                     start_time = time.time()
-                    await websocket.send(json.dumps(request))
+                    await websocket.send(request)
                     
                     try:
                         response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
                         response_time = time.time() - start_time
-                        self.monitor.record_request(response_time, True)
+                        self.monitor.record_request(response_time, True, "websocket")
                     except asyncio.TimeoutError:
-                        self.monitor.record_request(5.0, False)
+                        self.monitor.record_request(5.0, False, "websocket")
                     
                     await asyncio.sleep(1.0)  # 1초 간격
                     
@@ -426,74 +688,88 @@ class LoadTestRunner:
         
         self.monitor.start_monitoring()
         start_time = datetime.utcnow()
+        config_details = asdict(config)
         
-        # 데이터베이스 작업 시뮬레이션
-        tasks = []
-        for i in range(config.concurrent_users):
-            task = asyncio.create_task(
-                self._database_operations(f"worker_{i}", config.duration_seconds)
+        # 워커 수만큼 연결 풀과 실행 스레드 준비 (psycopg2는 블로킹 드라이버)
+        try:
+            self.pg_pool = psycopg2.pool.ThreadedConnectionPool(
+                1, config.concurrent_users,
+                host=POSTGRES_HOST,
+                port=POSTGRES_PORT,
+                database=POSTGRES_DB,
+                user=POSTGRES_USER,
+                password=POSTGRES_PASSWORD
             )
-            tasks.append(task)
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 풀 생성 오류: {str(e)}")
+            return self._analyze_results(TestType.DATABASE_STRESS, start_time, datetime.utcnow(), config_details)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.db_executor = ThreadPoolExecutor(max_workers=config.concurrent_users)
+        
+        try:
+            # 데이터베이스 작업 시뮬레이션
+            tasks = []
+            for i in range(config.concurrent_users):
+                task = asyncio.create_task(
+                    self._database_operations(f"worker_{i}", config.duration_seconds)
+                )
+                tasks.append(task)
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.db_executor.shutdown(wait=True)
+            self.pg_pool.closeall()
+            self.db_executor = None
+            self.pg_pool = None
         
         end_time = datetime.utcnow()
         
-        return self._analyze_results(TestType.DATABASE_STRESS, start_time, end_time, config)
+        return self._analyze_results(TestType.DATABASE_STRESS, start_time, end_time, config_details)
 
     async def _database_operations(self, worker_id: str, duration: int):
         """데이터베이스 작업 실행"""
         try:
-            conn = psycopg2.connect(
-                host=POSTGRES_HOST,
-                port=POSTGRES_PORT,
-                database=POSTGRES_DB,
-                user=POSTGRES_USER,
-                password=POSTGRES_PASSWORD,
-                cursor_factory=RealDictCursor
-            )
-            
+            loop = asyncio.get_event_loop()
             end_time = time.time() + duration
             
             while time.time() < end_time:
                 start_request = time.time()
-                success = False
                 
-                try:
-                    with conn.cursor() as cursor:
-                        # 다양한 쿼리 실행
-                        operation = random.choice([
-                            "SELECT COUNT(*) FROM sensors.devices",
-                            "SELECT * FROM sensors.sensor_readings ORDER BY created_at DESC LIMIT 100",
-                            "SELECT vehicle_id, COUNT(*) FROM sensors.sensor_readings GROUP BY vehicle_id LIMIT 50",
-                            "SELECT AVG(pressure_kpa) FROM sensors.tpms_data WHERE created_at > NOW() - INTERVAL '1 hour'"
-                        ])
-                        
-                        cursor.execute(operation)
-                        results = cursor.fetchall()
-                        success = True
-                        
-                except Exception as e:
-                    logger.debug(f"DB 쿼리 실패: {str(e)}")
-                    conn.rollback()
-                    success = False
+                # 다양한 쿼리 실행 (풀 연결 사용, 이벤트 루프 밖에서 실행)
+                operation = random.choice(DB_STRESS_QUERIES)
+                success = await loop.run_in_executor(self.db_executor, self._execute_db_query, operation)
                 
                 response_time = time.time() - start_request
-                self.monitor.record_request(response_time, success)
+                self.monitor.record_request(response_time, success, worker_id)
                 
                 await asyncio.sleep(random.uniform(0.1, 1.0))
-            
-            conn.close()
-            
+        
         except Exception as e:
             logger.error(f"데이터베이스 작업 오류: {str(e)}")
 
+    def _execute_db_query(self, query: str) -> bool:
+        """풀 연결로 쿼리 실행"""
+        conn = self.pg_pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                cursor.fetchall()  # 결과는 사용하지 않으므로 기본 튜플 커서로 수신
+            conn.commit()
+            return True
+        except Exception as e:
+            logger.debug(f"DB 쿼리 실패: {str(e)}")
+            conn.rollback()
+            return False
+        finally:
+            self.pg_pool.putconn(conn)
+
     async def run_concurrent_users_test(self, config: TestConfig) -> TestResult:
         """동시 사용자 테스트"""
         logger.info(f"👥 동시 사용자 테스트 시작 - {config.concurrent_users}명")
         
         self.monitor.start_monitoring()
         start_time = datetime.utcnow()
+        config_details = asdict(config)
         
         # 사용자 시나리오 시뮬레이션
         tasks = []
@@ -507,7 +783,7 @@ class LoadTestRunner:
         
         end_time = datetime.utcnow()
         
-        return self._analyze_results(TestType.CONCURRENT_USERS, start_time, end_time, config)
+        return self._analyze_results(TestType.CONCURRENT_USERS, start_time, end_time, config_details)
 
     async def _user_scenario_simulation(self, user_id: str, duration: int):
         """사용자 시나리오 시뮬레이션"""
@@ -542,14 +818,14 @@ class LoadTestRunner:
             success = False
             
             try:
-                async with self.session.get(f"{API_BASE_URL}{endpoint}") as response:
+                async with self.request_semaphore, self.session.get(f"{API_BASE_URL}{endpoint}") as response:
                     success = response.status < 400
-                    await response.text()
+                    await self._discard_body(response)
             except Exception:
                 success = False
             
             response_time = time.time() - start_time
-            self.monitor.record_request(response_time, success)
+            self.monitor.record_request(response_time, success, user_id)
             
             await asyncio.sleep(random.uniform(0.5, 2.0))
 
@@ -560,21 +836,21 @@ class LoadTestRunner:
         success = False
         
         try:
-            async with self.session.get(f"{API_BASE_URL}/sensors") as response:
+            async with self.request_semaphore, self.session.get(f"{API_BASE_URL}/sensors") as response:
                 success = response.status < 400
                 data = await response.json()
                 
                 if success and data:
-                    # 특정 센서 상세 정보 조회
+                    # 특정 센서 상세 정보 조회 (목록 요청의 슬롯을 그대로 사용)
                     sensor_id = random.choice(data[:10])["id"] if data else "1"
                     async with self.session.get(f"{API_BASE_URL}/sensors/{sensor_id}") as detail_response:
-                        await detail_response.text()
+                        await self._discard_body(detail_response)
                         
         except Exception:
             success = False
         
         response_time = time.time() - start_time
-        self.monitor.record_request(response_time, success)
+        self.monitor.record_request(response_time, success, user_id)
 
     async def _data_analysis(self, user_id: str):
         """데이터 분석 시뮬레이션"""
@@ -589,15 +865,15 @@ class LoadTestRunner:
                 "vehicle_ids": ",".join(random.sample(self.data_generator.vehicle_ids, 10))
             }
             
-            async with self.session.get(f"{API_BASE_URL}/analytics/trends", params=params) as response:
+            async with self.request_semaphore, self.session.get(f"{API_BASE_URL}/analytics/trends", params=params) as response:
                 success = response.status < 400
-                await response.text()
+                await self._discard_body(response)
                 
         except Exception:
             success = False
         
         response_time = time.time() - start_time
-        self.monitor.record_request(response_time, success)
+        self.monitor.record_request(response_time, success, user_id)
 
     async def _alert_management(self, user_id: str):
         """알림 관리 시뮬레이션"""
@@ -605,60 +881,47 @@ class LoadTestRunner:
         success = False
         
         try:
-            async with self.session.get(f"{API_BASE_URL}/alerts") as response:
+            async with self.request_semaphore, self.session.get(f"{API_BASE_URL}/alerts") as response:
                 success = response.status < 400
-                await response.text()
+                await self._discard_body(response)
                 
         except Exception:
             success = False
         
         response_time = time.time() - start_time
-        self.monitor.record_request(response_time, success)
+        self.monitor.record_request(response_time, success, user_id)
 
-    def _analyze_results(self, test_type: TestType, start_time: datetime, end_time: datetime, config: TestConfig) -> TestResult:
+    def _analyze_results(self, test_type: TestType, start_time: datetime, end_time: datetime, config_details: Dict[str, Any]) -> TestResult:
         """결과 분석"""
-        response_times = self.monitor.metrics['response_times']
-        errors = self.monitor.metrics['errors']
+        response_times = self.monitor.get_response_times()
+        errors = self.monitor.get_errors()
+        self.monitor.clear()  # 병합 후 워커별 원본 버퍼 해제
         
-        if not response_times:
-            return TestResult(
+        if not response_times.size:
+            return replace(
+                EMPTY_TEST_RESULT,
                 test_type=test_type,
                 start_time=start_time,
                 end_time=end_time,
-                total_requests=0,
-                successful_requests=0,
-                failed_requests=0,
-                avg_response_time=0,
-                p50_response_time=0,
-                p95_response_time=0,
-                p99_response_time=0,
-                max_response_time=0,
-                min_response_time=0,
-                throughput_rps=0,
-                error_rate=0,
-                cpu_usage_percent=0,
-                memory_usage_mb=0,
-                network_io_mb=0,
-                database_connections=0,
-                cache_hit_rate=0,
                 details={}
             )
         
-        total_requests = len(response_times)
-        failed_requests = sum(errors)
+        total_requests = int(response_times.size)
+        response_time_sum, min_response_time, max_response_time, failed_requests = fused_stats(response_times, errors)
+        min_response_time = float(min_response_time)
+        max_response_time = float(max_response_time)
+        failed_requests = int(failed_requests)
         successful_requests = total_requests - failed_requests
         
         duration = (end_time - start_time).total_seconds()
         throughput_rps = total_requests / duration if duration > 0 else 0
         error_rate = failed_requests / total_requests if total_requests > 0 else 0
         
-        # 응답 시간 통계
-        avg_response_time = statistics.mean(response_times)
-        p50_response_time = np.percentile(response_times, 50)
-        p95_response_time = np.percentile(response_times, 95)
-        p99_response_time = np.percentile(response_times, 99)
-        max_response_time = max(response_times)
-        min_response_time = min(response_times)
+        # 응답 시간 통계 (병합된 배열은 복사본이므로 분위수 계산 시 제자리 부분 정렬 허용)
+        p10, p25, p50_response_time, p75, p90, p95_response_time, p99_response_time = (
+            np.quantile(response_times, RESPONSE_TIME_QUANTILES, overwrite_input=True).tolist()
+        )
+        avg_response_time = float(response_time_sum) / total_requests
         
         # 시스템 메트릭 (시뮬레이션)
         cpu_usage = random.uniform(30, 80)
@@ -685,47 +948,151 @@ class LoadTestRunner:
             database_connections=random.randint(10, 50),
             cache_hit_rate=random.uniform(0.85, 0.98),
             details={
-                'config': asdict(config),
+                'config': config_details,
                 'response_time_distribution': {
-                    'p10': np.percentile(response_times, 10),
-                    'p25': np.percentile(response_times, 25),
-                    'p75': np.percentile(response_times, 75),
-                    'p90': np.percentile(response_times, 90)
+                    'p10': p10,
+                    'p25': p25,
+                    'p75': p75,
+                    'p90': p90
                 }
             }
         )
 
+# HTML 리포트 고정 영역 (리포트마다 다시 포맷하지 않음)
+HTML_REPORT_HEAD = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>HankookTire SmartSensor 2.0 - Performance Test Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #1e88e5; color: white; padding: 20px; border-radius: 8px; }
+        .summary { background: #f5f5f5; padding: 15px; border-radius: 8px; margin: 20px 0; }
+        .test-result { border: 1px solid #ddd; margin: 10px 0; border-radius: 8px; }
+        .test-header { background: #e3f2fd; padding: 10px; font-weight: bold; }
+        .test-details { padding: 15px; }
+        .metric { display: inline-block; margin: 10px; text-align: center; }
+        .metric-value { font-size: 24px; font-weight: bold; color: #1976d2; }
+        .metric-label { font-size: 12px; color: #666; }
+        .chart { text-align: center; margin: 20px 0; }
+        .status-good { color: #4caf50; }
+        .status-warning { color: #ff9800; }
+        .status-error { color: #f44336; }
+    </style>
+</head>
+"""
+
+HTML_REPORT_FOOTER = """
+</body>
+</html>
+"""
+
+# 테스트 결과별 HTML 조각 (%-포맷 템플릿)
+HTML_RESULT_TEMPLATE = """
+    <div class="test-result">
+        <div class="test-header">
+            %(title)s Test
+            <span class="%(status_class)s">(%(status_badge)s)</span>
+        </div>
+        <div class="test-details">
+            <div class="metric">
+                <div class="metric-value">%(total_requests)s</div>
+                <div class="metric-label">Total Requests</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(avg_response_time).3fs</div>
+                <div class="metric-label">Avg Response Time</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(p95_response_time).3fs</div>
+                <div class="metric-label">95th Percentile</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(throughput_rps).1f</div>
+                <div class="metric-label">Requests/sec</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(error_rate_percent).2f%%</div>
+                <div class="metric-label">Error Rate</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(cpu_usage_percent).1f%%</div>
+                <div class="metric-label">CPU Usage</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">%(memory_usage_mb).0fMB</div>
+                <div class="metric-label">Memory Usage</div>
+            </div>
+        </div>
+    </div>
+"""
+
+# 차트용 결과 필드 추출기 (결과당 한 번의 C 호출로 튜플 생성)
+CHART_FIELDS = attrgetter(
+    'test_type.value',
+    'avg_response_time',
+    'p95_response_time',
+    'throughput_rps',
+    'error_rate',
+    'cpu_usage_percent',
+    'memory_usage_mb'
+)
+
+# 오류율 구간별 상태 표시 (0: 1% 이하, 1: 5% 이하, 2: 5% 초과)
+RESULT_STATUS = [
+    ("status-good", "✅ PASS"),
+    ("status-warning", "✅ PASS"),
+    ("status-error", "❌ FAIL")
+]
+
 class PerformanceReporter:
     """성능 리포트 생성기"""
     
-    def __init__(self):
+    def __init__(self, output_dir: str = "./performance_reports"):
         self.results = []
+        self.output_dir = output_dir
+        plt.style.use('seaborn-v0_8')  # 스타일은 한 번만 로드
         
     def add_result(self, result: TestResult):
-        """결과 추가"""
+        """결과 추가 (완료 즉시 JSON Lines 파일에 기록)"""
         self.results.append(result)
         
-    def generate_report(self, output_dir: str = "./performance_reports"):
+        # 첫 결과에서 파일을 새로 만들고 이후에는 이어 쓰기
+        os.makedirs(self.output_dir, exist_ok=True)
+        mode = 'wb' if len(self.results) == 1 else 'ab'
+        with open(f"{self.output_dir}/test_results.jsonl", mode) as f:
+            f.write(orjson.dumps(asdict(result), option=orjson.OPT_APPEND_NEWLINE))
+
+    def generate_report(self, output_dir: Optional[str] = None):
         """성능 리포트 생성"""
+        output_dir = output_dir or self.output_dir
         os.makedirs(output_dir, exist_ok=True)
         
+        # 리포트 생성 시각 (모든 산출물에 동일하게 사용)
+        generated_at = datetime.now(timezone.utc)
+        
         # JSON 리포트
-        self._generate_json_report(output_dir)
+        self._generate_json_report(output_dir, generated_at)
+        
+        # 전체 결과 압축 보관본 (CI/대시보드 전송용)
+        self._generate_results_archive(output_dir)
         
         # 차트 생성
-        self._generate_charts(output_dir)
+        self._generate_charts(output_dir, self._results_frame())
         
         # HTML 리포트
-        self._generate_html_report(output_dir)
+        self._generate_html_report(output_dir, generated_at)
         
         logger.info(f"✅ 성능 리포트 생성 완료: {output_dir}")
 
-    def _generate_json_report(self, output_dir: str):
+    def _generate_json_report(self, output_dir: str, generated_at: datetime):
         """JSON 리포트 생성"""
         report_data = {
             'test_summary': {
                 'total_tests': len(self.results),
-                'generated_at': datetime.utcnow().isoformat(),
+                'generated_at': generated_at.isoformat(),
                 'test_types': list(set(r.test_type.value for r in self.results))
             },
             'test_results': [
@@ -749,24 +1116,44 @@ class PerformanceReporter:
             ]
         }
         
-        with open(f"{output_dir}/performance_report.json", 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        with open(f"{output_dir}/performance_report.json", 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
 
-    def _generate_charts(self, output_dir: str):
+    def _results_frame(self) -> pd.DataFrame:
+        """차트용 결과 DataFrame 생성 (결과 목록을 한 번만 순회)"""
+        return pd.DataFrame.from_records(
+            list(map(CHART_FIELDS, self.results)),
+            columns=[
+                'test_type',
+                'avg_response_time',
+                'p95_response_time',
+                'throughput_rps',
+                'error_rate',
+                'cpu_usage_percent',
+                'memory_usage_mb'
+            ]
+        )
+
+    def _generate_results_archive(self, output_dir: str):
+        """전체 테스트 결과 gzip JSON 생성"""
+        with gzip.open(f"{output_dir}/results.json.gz", 'wb', compresslevel=3) as f:
+            f.write(orjson.dumps(
+                [asdict(r) for r in self.results],
+                option=orjson.OPT_SERIALIZE_NUMPY
+            ))
+
+    def _generate_charts(self, output_dir: str, frame: pd.DataFrame):
         """차트 생성"""
-        if not self.results:
+        if frame.empty:
             return
-            
-        plt.style.use('seaborn-v0_8')
         
         # 응답 시간 분포 차트
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('HankookTire SmartSensor 2.0 - Performance Test Results', fontsize=16)
         
         # 1. 응답 시간 비교
-        test_types = [r.test_type.value for r in self.results]
-        avg_times = [r.avg_response_time for r in self.results]
-        p95_times = [r.p95_response_time for r in self.results]
+        test_types = frame['test_type'].to_numpy()
+        avg_times, p95_times = frame[['avg_response_time', 'p95_response_time']].to_numpy().T
         
         x = np.arange(len(test_types))
         width = 0.35
@@ -781,7 +1168,7 @@ class PerformanceReporter:
         axes[0, 0].legend()
         
         # 2. 처리량 비교
-        throughputs = [r.throughput_rps for r in self.results]
+        throughputs = frame['throughput_rps'].to_numpy()
         axes[0, 1].bar(test_types, throughputs, alpha=0.8, color='green')
         axes[0, 1].set_xlabel('Test Type')
         axes[0, 1].set_ylabel('Throughput (requests/sec)')
@@ -789,7 +1176,7 @@ class PerformanceReporter:
         axes[0, 1].tick_params(axis='x', rotation=45)
         
         # 3. 오류율 비교
-        error_rates = [r.error_rate * 100 for r in self.results]
+        error_rates = frame['error_rate'].to_numpy() * 100
         axes[1, 0].bar(test_types, error_rates, alpha=0.8, color='red')
         axes[1, 0].set_xlabel('Test Type')
         axes[1, 0].set_ylabel('Error Rate (%)')
@@ -797,10 +1184,9 @@ class PerformanceReporter:
         axes[1, 0].tick_params(axis='x', rotation=45)
         
         # 4. 리소스 사용률
-        cpu_usage = [r.cpu_usage_percent for r in self.results]
-        memory_usage = [r.memory_usage_mb / 1000 for r in self.results]  # GB 변환
+        cpu_usage = frame['cpu_usage_percent'].to_numpy()
+        memory_usage = frame['memory_usage_mb'].to_numpy() / 1000  # GB 변환
         
-        x = np.arange(len(test_types))
         axes[1, 1].bar(x - width/2, cpu_usage, width, label='CPU (%)', alpha=0.8)
         axes[1, 1].bar(x + width/2, memory_usage, width, label='Memory (GB)', alpha=0.8)
         axes[1, 1].set_xlabel('Test Type')
@@ -811,57 +1197,42 @@ class PerformanceReporter:
         axes[1, 1].legend()
         
         plt.tight_layout()
-        plt.savefig(f"{output_dir}/performance_charts.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/performance_charts.png", dpi=CHART_DPI, bbox_inches='tight')
+        plt.close(fig)
 
-    def _generate_html_report(self, output_dir: str):
+    def _generate_html_report(self, output_dir: str, generated_at: datetime):
         """HTML 리포트 생성"""
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>HankookTire SmartSensor 2.0 - Performance Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background: #1e88e5; color: white; padding: 20px; border-radius: 8px; }}
-        .summary {{ background: #f5f5f5; padding: 15px; border-radius: 8px; margin: 20px 0; }}
-        .test-result {{ border: 1px solid #ddd; margin: 10px 0; border-radius: 8px; }}
-        .test-header {{ background: #e3f2fd; padding: 10px; font-weight: bold; }}
-        .test-details {{ padding: 15px; }}
-        .metric {{ display: inline-block; margin: 10px; text-align: center; }}
-        .metric-value {{ font-size: 24px; font-weight: bold; color: #1976d2; }}
-        .metric-label {{ font-size: 12px; color: #666; }}
-        .chart {{ text-align: center; margin: 20px 0; }}
-        .status-good {{ color: #4caf50; }}
-        .status-warning {{ color: #ff9800; }}
-        .status-error {{ color: #f44336; }}
-    </style>
-</head>
-<body>
+        # 요약 지표 집계 (attrgetter + map으로 C 레벨 순회)
+        test_count = len(self.results)
+        total_requests = sum(map(attrgetter('total_requests'), self.results))
+        successful_requests = sum(map(attrgetter('successful_requests'), self.results))
+        error_rate_sum = sum(map(attrgetter('error_rate'), self.results))
+        average_error_rate = error_rate_sum / (test_count or 1)
+        
+        parts = [HTML_REPORT_HEAD]
+        parts.append(f"""<body>
     <div class="header">
         <h1>🚀 HankookTire SmartSensor 2.0</h1>
         <h2>Performance Test Report</h2>
-        <p>Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
+        <p>Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
     </div>
     
     <div class="summary">
         <h3>📊 Test Summary</h3>
         <div class="metric">
-            <div class="metric-value">{len(self.results)}</div>
+            <div class="metric-value">{test_count}</div>
             <div class="metric-label">Total Tests</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{sum(r.total_requests for r in self.results):,}</div>
+            <div class="metric-value">{total_requests:,}</div>
             <div class="metric-label">Total Requests</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{sum(r.successful_requests for r in self.results):,}</div>
+            <div class="metric-value">{successful_requests:,}</div>
             <div class="metric-label">Successful Requests</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{(sum(r.error_rate for r in self.results) / len(self.results) * 100):.2f}%</div>
+            <div class="metric-value">{average_error_rate * 100:.2f}%</div>
             <div class="metric-label">Average Error Rate</div>
         </div>
     </div>
@@ -869,65 +1240,91 @@ class PerformanceReporter:
     <div class="chart">
         <img src="performance_charts.png" alt="Performance Charts" style="max-width: 100%;">
     </div>
-"""
+""")
         
         for result in self.results:
-            status_class = "status-good"
-            if result.error_rate > 0.05:
-                status_class = "status-error"
-            elif result.error_rate > 0.01:
-                status_class = "status-warning"
-                
-            html_content += f"""
-    <div class="test-result">
-        <div class="test-header">
-            {result.test_type.value.replace('_', ' ').title()} Test
-            <span class="{status_class}">({'✅ PASS' if result.error_rate <= 0.05 else '❌ FAIL'})</span>
-        </div>
-        <div class="test-details">
-            <div class="metric">
-                <div class="metric-value">{result.total_requests:,}</div>
-                <div class="metric-label">Total Requests</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.avg_response_time:.3f}s</div>
-                <div class="metric-label">Avg Response Time</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.p95_response_time:.3f}s</div>
-                <div class="metric-label">95th Percentile</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.throughput_rps:.1f}</div>
-                <div class="metric-label">Requests/sec</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.error_rate*100:.2f}%</div>
-                <div class="metric-label">Error Rate</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.cpu_usage_percent:.1f}%</div>
-                <div class="metric-label">CPU Usage</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{result.memory_usage_mb:.0f}MB</div>
-                <div class="metric-label">Memory Usage</div>
-            </div>
-        </div>
-    </div>
-"""
-        
-        html_content += """
-</body>
-</html>
-"""
-        
-        with open(f"{output_dir}/performance_report.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            status_class, status_badge = RESULT_STATUS[(result.error_rate > 0.01) + (result.error_rate > 0.05)]
+            
+            parts.append(HTML_RESULT_TEMPLATE % {
+                'title': result.test_type.value.replace('_', ' ').title(),
+                'status_class': status_class,
+                'status_badge': status_badge,
+                'total_requests': f"{result.total_requests:,}",
+                'avg_response_time': result.avg_response_time,
+                'p95_response_time': result.p95_response_time,
+                'throughput_rps': result.throughput_rps,
+                'error_rate_percent': result.error_rate * 100,
+                'cpu_usage_percent': result.cpu_usage_percent,
+                'memory_usage_mb': result.memory_usage_mb
+            })
+        
+        parts.append(HTML_REPORT_FOOTER)
+        html_bytes = "".join(parts).encode('utf-8')
+        
+        self._write_file(f"{output_dir}/performance_report.html", html_bytes)
+        
+        # 사전 압축본 (Content-Encoding: gzip으로 바로 제공 가능)
+        self._write_file(f"{output_dir}/performance_report.html.gz", gzip.compress(html_bytes, compresslevel=6))
+
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        """인코딩된 버퍼를 그대로 파일에 기록 (부분 쓰기 시 나머지 이어서 기록)"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
+def install_event_loop():
+    """부하 생성기용 이벤트 루프 설치 (uvloop 우선, 없으면 기본 루프)"""
+    if uvloop is not None and sys.platform != 'win32':
+        uvloop.install()
+    else:
+        logger.warning("⚠️ uvloop 사용 불가 - 기본 asyncio 이벤트 루프로 실행")
+
+# 테스트 타입별 실행 메서드
+TEST_DISPATCH: Dict[TestType, Callable[[LoadTestRunner, TestConfig], Awaitable[TestResult]]] = {
+    TestType.API_LOAD: LoadTestRunner.run_api_load_test,
+    TestType.SENSOR_STREAMING: LoadTestRunner.run_sensor_streaming_test,
+    TestType.DATABASE_STRESS: LoadTestRunner.run_database_stress_test,
+    TestType.CONCURRENT_USERS: LoadTestRunner.run_concurrent_users_test
+}
+
+async def run_test(config: TestConfig, reporter: PerformanceReporter,
+                   test_slots: Optional[asyncio.Semaphore] = None) -> bool:
+    """단일 테스트 실행 (테스트마다 독립된 러너/세션/모니터 사용)"""
+    run = TEST_DISPATCH.get(config.test_type)
+    if run is None:
+        return False
+    
+    try:
+        async with test_slots or nullcontext():
+            logger.info(f"🧪 {config.test_type.value} 테스트 실행 중...")
+            async with LoadTestRunner(config.concurrent_users) as runner:
+                result = await run(runner, config)
+        
+        reporter.add_result(result)
+        
+        # 결과 출력
+        logger.info(f"✅ {config.test_type.value} 테스트 완료:")
+        logger.info(f"   총 요청: {result.total_requests:,}")
+        logger.info(f"   성공률: {(result.successful_requests/result.total_requests*100):.1f}%")
+        logger.info(f"   평균 응답시간: {result.avg_response_time:.3f}초")
+        logger.info(f"   처리량: {result.throughput_rps:.1f} req/sec")
+        logger.info(f"   95% 응답시간: {result.p95_response_time:.3f}초")
+        return True
+    
+    except Exception as e:
+        logger.error(f"❌ {config.test_type.value} 테스트 실패: {str(e)}")
+        return False
 
 async def main():
     """메인 실행 함수"""
     logger.info("🚀 HankookTire SmartSensor 2.0 성능 테스트 시작")
+    logger.info(f"⚙️ 이벤트 루프 정책: {type(asyncio.get_event_loop_policy()).__name__}")
     
     # 테스트 설정
     test_configs = [
@@ -967,37 +1364,20 @@ async def main():
     
     reporter = PerformanceReporter()
     
-    async with LoadTestRunner() as runner:
-        for config in test_configs:
-            logger.info(f"🧪 {config.test_type.value} 테스트 실행 중...")
-            
-            try:
-                if config.test_type == TestType.API_LOAD:
-                    result = await runner.run_api_load_test(config)
-                elif config.test_type == TestType.SENSOR_STREAMING:
-                    result = await runner.run_sensor_streaming_test(config)
-                elif config.test_type == TestType.DATABASE_STRESS:
-                    result = await runner.run_database_stress_test(config)
-                elif config.test_type == TestType.CONCURRENT_USERS:
-                    result = await runner.run_concurrent_users_test(config)
-                else:
-                    continue
-                
-                reporter.add_result(result)
-                
-                # 결과 출력
-                logger.info(f"✅ {config.test_type.value} 테스트 완료:")
-                logger.info(f"   총 요청: {result.total_requests:,}")
-                logger.info(f"   성공률: {(result.successful_requests/result.total_requests*100):.1f}%")
-                logger.info(f"   평균 응답시간: {result.avg_response_time:.3f}초")
-                logger.info(f"   처리량: {result.throughput_rps:.1f} req/sec")
-                logger.info(f"   95% 응답시간: {result.p95_response_time:.3f}초")
-                
-            except Exception as e:
-                logger.error(f"❌ {config.test_type.value} 테스트 실패: {str(e)}")
+    if RUN_TESTS_CONCURRENTLY:
+        # 테스트 동시 실행 (최대 MAX_CONCURRENT_TESTS개, 실패는 run_test에서 기록 후 종료)
+        test_slots = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+        async with asyncio.TaskGroup() as tg:
+            for config in test_configs:
+                tg.create_task(run_test(config, reporter, test_slots))
+    else:
+        # 테스트 간 간섭 없이 개별 측정이 필요한 경우 순차 실행
+        for index, config in enumerate(test_configs):
+            completed = await run_test(config, reporter)
             
-            # 테스트 간 휴식
-            await asyncio.sleep(10)
+            # 실제로 실행된 테스트 사이에만 휴식
+            if completed and index < len(test_configs) - 1:
+                await asyncio.sleep(TEST_COOLDOWN_SECONDS)
     
     # 리포트 생성
     reporter.generate_report()
@@ -1005,4 +1385,5 @@ async def main():
     logger.info("🎉 모든 성능 테스트 완료!")
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
\ No newline at end of file
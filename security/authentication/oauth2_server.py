@@ -17,26 +17,30 @@ import jwt
 import bcrypt
 import secrets
 import hashlib
+import hmac
 import pyotp
 import qrcode
 import io
 import base64
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
-import json
+import orjson
 import logging
 import os
-import redis
+import redis.asyncio
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.pool
+from psycopg2.extras import RealDictCursor, execute_values
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from aiohttp import web, web_middlewares
 from aiohttp.web_exceptions import HTTPUnauthorized, HTTPForbidden, HTTPBadRequest
 import time
 import re
+from functools import lru_cache
 from ipaddress import ip_address, ip_network
 
 # 설정
@@ -44,20 +48,94 @@ JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', secrets.token_hex(32))
 JWT_ALGORITHM = 'HS256'
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = 30
+JWT_CACHE_MAX_SIZE = int(os.getenv('JWT_CACHE_MAX_SIZE', '50000'))
+JWT_CACHE_TTL = int(os.getenv('JWT_CACHE_TTL', '300'))  # 서명 검증 결과 캐시 최대 유지 시간(초, 취소 확인은 매 요청)
+API_KEY_CACHE_MAX_SIZE = int(os.getenv('API_KEY_CACHE_MAX_SIZE', '10000'))
+API_KEY_CACHE_TTL = int(os.getenv('API_KEY_CACHE_TTL', '60'))
 
 POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'postgres-service')
 POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'smarttire_sensors')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'smarttire')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'password')
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', '5'))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '50'))
 
 REDIS_HOST = os.getenv('REDIS_HOST', 'redis-service')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '100'))
 
 RATE_LIMIT_REQUESTS = int(os.getenv('RATE_LIMIT_REQUESTS', '100'))
 RATE_LIMIT_WINDOW = int(os.getenv('RATE_LIMIT_WINDOW', '3600'))  # 1시간
 
+# 연결당 한 번 PREPARE하는 문장 (이름 -> SQL)
+PREPARED_STATEMENTS = {
+    'insert_user': """
+        INSERT INTO auth.users (username, email, password_hash, role)
+        VALUES ($1, $2, $3, $4)
+        RETURNING *
+    """,
+    'select_user': """
+        SELECT * FROM auth.users WHERE username = $1 AND is_active = TRUE
+    """,
+    'insert_api_key': """
+        INSERT INTO auth.api_keys (key_hash, name, user_id, permissions, expires_at)
+        VALUES ($1, $2, $3, $4, $5)
+    """,
+    'select_api_key': """
+        SELECT id, key_hash, name, user_id, permissions, is_active, expires_at, created_at, last_used
+        FROM auth.api_keys
+        WHERE key_hash = $1 AND is_active = TRUE
+          AND (expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)
+    """,
+    'insert_blacklist': """
+        INSERT INTO auth.token_blacklist (token_jti, expires_at)
+        VALUES ($1, $2)
+        ON CONFLICT (token_jti) DO NOTHING
+    """,
+    # 로그인 결과에 따른 사용자 상태 갱신과 이벤트 기록을 단일 문장(단일 트랜잭션)으로 처리
+    'login_success': """
+        WITH u AS (
+            UPDATE auth.users SET login_attempts = 0, last_login = CURRENT_TIMESTAMP
+            WHERE id = $1
+            RETURNING id
+        )
+        INSERT INTO auth.security_events (event_type, user_id, ip_address, user_agent, details)
+        SELECT $2::varchar, u.id, $3::inet, $4::text, $5::jsonb FROM u
+    """,
+    'login_failure': """
+        WITH u AS (
+            UPDATE auth.users SET login_attempts = login_attempts + 1
+            WHERE id = $1
+            RETURNING id
+        )
+        INSERT INTO auth.security_events (event_type, user_id, ip_address, user_agent, details)
+        SELECT $2::varchar, u.id, $3::inet, $4::text, $5::jsonb FROM u
+    """,
+}
+
+# INCR + 최초 1회 EXPIRE를 원자적으로 수행 (단일 RTT)
+RATE_LIMIT_LUA = (
+    "local c = redis.call('INCR', KEYS[1]) "
+    "if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    "return c"
+)
+
+SECURITY_EVENT_QUEUE_SIZE = int(os.getenv('SECURITY_EVENT_QUEUE_SIZE', '10000'))
+SECURITY_EVENT_BATCH_SIZE = int(os.getenv('SECURITY_EVENT_BATCH_SIZE', '500'))
+SECURITY_EVENT_FLUSH_INTERVAL = float(os.getenv('SECURITY_EVENT_FLUSH_INTERVAL', '0.1'))  # 초
+
+SECURITY_EVENT_PARTITIONS_AHEAD = int(os.getenv('SECURITY_EVENT_PARTITIONS_AHEAD', '1'))  # 미리 만들 다음 달 파티션 수
+SECURITY_EVENT_PARTITION_CHECK_INTERVAL = int(os.getenv('SECURITY_EVENT_PARTITION_CHECK_INTERVAL', '86400'))  # 초
+
+TOTP_CACHE_SIZE = int(os.getenv('TOTP_CACHE_SIZE', '10000'))
+
+# bcrypt 비용 계수 (1 증가 시 해시 시간 2배: 저사양 환경은 낮추고 고사양 환경은 높여 조정)
+BCRYPT_COST = int(os.getenv('BCRYPT_COST', '12'))
+BCRYPT_WORKERS = int(os.getenv('BCRYPT_WORKERS', str((os.cpu_count() or 1) * 2)))
+BCRYPT_MAX_PENDING = int(os.getenv('BCRYPT_MAX_PENDING', '500'))  # 초과 시 503 반환
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -97,7 +175,7 @@ class SecurityEventType(Enum):
     API_KEY_CREATED = "api_key_created"
     API_KEY_REVOKED = "api_key_revoked"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """사용자 모델"""
     id: int
@@ -137,35 +215,137 @@ class SecurityEvent:
     details: Dict
     timestamp: datetime = None
 
+def b64url_decode(segment: str) -> bytes:
+    """패딩 없는 base64url 디코딩"""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+@lru_cache(maxsize=TOTP_CACHE_SIZE)
+def get_totp(secret: str) -> pyotp.TOTP:
+    """시크릿별 TOTP 객체 재사용 (시크릿 교체 시 자동으로 새 항목 사용)"""
+    return pyotp.TOTP(secret)
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """세션에 PREPARE된 문장 이름을 추적하는 연결"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
 class SecurityManager:
     """보안 관리자 클래스"""
     
     def __init__(self):
         self.redis_client = None
+        self.rl_sha = None
         self.db_pool = None
+        # 블로킹 psycopg2 호출을 이벤트 루프 밖에서 실행 (풀 최대 연결 수와 동일)
+        self.db_executor = ThreadPoolExecutor(max_workers=DB_POOL_MAX_SIZE)
+        # bcrypt 연산 전용 스레드풀 (로그인 하나가 이벤트 루프를 점유하지 않도록)
+        self.bcrypt_pool = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS)
+        self.bcrypt_pending = 0
+        # 키 스케줄을 마친 HS256 HMAC 컨텍스트 (검증마다 copy()로 재사용)
+        self._jwt_hmac = hmac.new(JWT_SECRET_KEY.encode('utf-8'), digestmod=hashlib.sha256)
+        # 검증된 JWT 캐시 (토큰 해시 -> (페이로드, 캐시 만료 시각)) 및 jti -> 토큰 해시 역인덱스
+        self.jwt_cache: Dict[bytes, Tuple[Dict, float]] = {}
+        self.jwt_cache_jti: Dict[str, bytes] = {}
+        # 검증된 API 키 캐시 (키 해시 -> (API 키, 캐시 만료 시각))
+        self.apikey_cache: Dict[str, Tuple[APIKey, float]] = {}
+        # 보안 이벤트 배치 저장 대기열 (가득 차면 가장 오래된 이벤트 폐기)
+        self._event_q: asyncio.Queue = asyncio.Queue(maxsize=SECURITY_EVENT_QUEUE_SIZE)
+        self._event_task = None
+        self._partition_task = None
+        self.dropped_events = 0
         
     async def initialize(self):
         """초기화"""
         # Redis 연결
-        self.redis_client = redis.Redis(
+        self.redis_client = redis.asyncio.Redis(
             host=REDIS_HOST,
             port=REDIS_PORT,
             password=REDIS_PASSWORD if REDIS_PASSWORD else None,
-            decode_responses=True
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS
         )
         
-        # 데이터베이스 테이블 생성
-        await self.create_security_tables()
+        # 속도 제한 Lua 스크립트 사전 로드
+        try:
+            self.rl_sha = await self.redis_client.script_load(RATE_LIMIT_LUA)
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ 속도 제한 스크립트 로드 실패 (첫 요청 시 재시도): {str(e)}")
         
-    async def create_security_tables(self):
-        """보안 관련 테이블 생성"""
-        conn = psycopg2.connect(
+        # 데이터베이스 연결 풀 (요청마다 연결/인증 핸드셰이크 방지)
+        self.db_pool = psycopg2.pool.ThreadedConnectionPool(
+            DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE,
             host=POSTGRES_HOST,
             port=POSTGRES_PORT,
             database=POSTGRES_DB,
             user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
+            password=POSTGRES_PASSWORD,
+            connection_factory=PreparedConnection
+        )
+        
+        # 데이터베이스 테이블 생성
+        await self.create_security_tables()
+        
+        # 보안 이벤트 배치 저장 및 월별 파티션 관리 태스크 시작
+        self._event_task = asyncio.create_task(self._event_flusher())
+        self._partition_task = asyncio.create_task(self._partition_maintainer())
+
+    async def close(self):
+        """연결 풀 및 스레드풀 정리"""
+        if self._partition_task:
+            self._partition_task.cancel()
+        
+        if self._event_task:
+            self._event_task.cancel()
+            try:
+                await self._event_task
+            except asyncio.CancelledError:
+                pass
+            
+            # 남은 이벤트 저장
+            remaining = []
+            while not self._event_q.empty():
+                remaining.append(self._event_q.get_nowait())
+            if remaining:
+                await self._flush_events(remaining)
+        
+        if self.db_pool:
+            self.db_pool.closeall()
+        if self.redis_client:
+            await self.redis_client.close()
+        self.db_executor.shutdown(wait=False)
+        self.bcrypt_pool.shutdown(wait=False)
+
+    def _execute(self, name: str, params: tuple, fetch: bool = False) -> Optional[Dict]:
+        """풀 연결로 준비된 문장 실행 및 커밋 (스레드풀에서 호출)"""
+        conn = self.db_pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                # 연결당 한 번만 PREPARE (이후 EXECUTE는 파싱/플래닝 생략)
+                if name not in conn.prepared_statements:
+                    cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+                    conn.prepared_statements.add(name)
+                
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+                row = cursor.fetchone() if fetch else None
+            conn.commit()
+            return row
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.db_pool.putconn(conn)
+
+    async def _run_db(self, name: str, params: tuple, fetch: bool = False) -> Optional[Dict]:
+        """블로킹 DB 작업을 스레드풀에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.db_executor, self._execute, name, params, fetch
         )
+
+    async def create_security_tables(self):
+        """보안 관련 테이블 생성"""
+        conn = self.db_pool.getconn()
         
         try:
             with conn.cursor() as cursor:
@@ -202,17 +382,18 @@ class SecurityManager:
                     )
                 """)
                 
-                # 보안 이벤트 테이블
+                # 보안 이벤트 테이블 (추가 전용, timestamp 기준 월별 파티션)
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS auth.security_events (
-                        id SERIAL PRIMARY KEY,
+                        id SERIAL,
                         event_type VARCHAR(50) NOT NULL,
                         user_id INTEGER REFERENCES auth.users(id),
                         ip_address INET NOT NULL,
                         user_agent TEXT,
                         details JSONB NOT NULL,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
+                        timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (id, timestamp)
+                    ) PARTITION BY RANGE (timestamp)
                 """)
                 
                 # 토큰 블랙리스트 테이블
@@ -226,7 +407,11 @@ class SecurityManager:
                 """)
                 
                 # 인덱스 생성
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_security_events_timestamp ON auth.security_events(timestamp)")
+                # 시간순 추가 데이터이므로 B-tree 대신 BRIN (삽입 유지 비용 최소화)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_security_events_timestamp_brin
+                    ON auth.security_events USING BRIN (timestamp) WITH (pages_per_range = 32)
+                """)
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_security_events_user_id ON auth.security_events(user_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON auth.api_keys(user_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_blacklist_jti ON auth.token_blacklist(token_jti)")
@@ -239,16 +424,69 @@ class SecurityManager:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self.db_pool.putconn(conn)
+        
+        self._create_event_partitions()
+
+    def _create_event_partitions(self):
+        """보안 이벤트 월별 파티션 생성 (이번 달부터 SECURITY_EVENT_PARTITIONS_AHEAD개월 후까지)"""
+        conn = self.db_pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'auth.security_events'::regclass"
+                )
+                
+                # 파티션 도입 이전에 생성된 기존 테이블은 그대로 사용
+                if cursor.fetchone():
+                    # 범위 밖 이벤트 유실 방지용 기본 파티션
+                    cursor.execute(
+                        "CREATE TABLE IF NOT EXISTS auth.security_events_default "
+                        "PARTITION OF auth.security_events DEFAULT"
+                    )
+                    
+                    start = date.today().replace(day=1)
+                    for _ in range(SECURITY_EVENT_PARTITIONS_AHEAD + 1):
+                        end = (start + timedelta(days=32)).replace(day=1)
+                        cursor.execute(
+                            f"CREATE TABLE IF NOT EXISTS auth.security_events_{start:%Y_%m} "
+                            f"PARTITION OF auth.security_events FOR VALUES FROM ('{start}') TO ('{end}')"
+                        )
+                        start = end
+            
+            conn.commit()
+        
+        except Exception as e:
+            logger.error(f"❌ 보안 이벤트 파티션 생성 실패: {str(e)}")
+            conn.rollback()
+        finally:
+            self.db_pool.putconn(conn)
+
+    async def _partition_maintainer(self):
+        """보안 이벤트 파티션 주기적 생성"""
+        while True:
+            await asyncio.sleep(SECURITY_EVENT_PARTITION_CHECK_INTERVAL)
+            await asyncio.get_running_loop().run_in_executor(self.db_executor, self._create_event_partitions)
+
+    async def _run_bcrypt(self, func, *args):
+        """bcrypt 연산을 전용 스레드풀에서 실행 (대기열 초과 시 503)"""
+        if self.bcrypt_pending >= BCRYPT_MAX_PENDING:
+            raise web.HTTPServiceUnavailable(reason="Authentication backend busy", headers={'Retry-After': '1'})
+        
+        self.bcrypt_pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.bcrypt_pool, func, *args)
+        finally:
+            self.bcrypt_pending -= 1
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """비밀번호 해시화"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        hashed = await self._run_bcrypt(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_COST))
+        return hashed.decode('utf-8')
 
-    def verify_password(self, password: str, hashed: str) -> bool:
+    async def verify_password(self, password: str, hashed: str) -> bool:
         """비밀번호 검증"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        return await self._run_bcrypt(bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
 
     def generate_api_key(self) -> str:
         """API 키 생성"""
@@ -262,8 +500,8 @@ class SecurityManager:
         """MFA 시크릿 생성"""
         return pyotp.random_base32()
 
-    def generate_mfa_qr_code(self, username: str, secret: str) -> str:
-        """MFA QR 코드 생성"""
+    def generate_mfa_qr_code(self, username: str, secret: str) -> bytes:
+        """MFA QR 코드 PNG 생성"""
         totp_uri = pyotp.totp.TOTP(secret).provisioning_uri(
             name=username,
             issuer_name="HankookTire SmartSensor"
@@ -276,218 +514,289 @@ class SecurityManager:
         img = qr.make_image(fill_color="black", back_color="white")
         buffer = io.BytesIO()
         img.save(buffer, format='PNG')
-        buffer.seek(0)
         
-        return base64.b64encode(buffer.getvalue()).decode()
+        return buffer.getvalue()
+
+    def generate_mfa_qr_code_base64(self, username: str, secret: str) -> str:
+        """MFA QR 코드 (JSON 응답용 base64)"""
+        return base64.b64encode(self.generate_mfa_qr_code(username, secret)).decode()
 
     def verify_mfa_token(self, secret: str, token: str) -> bool:
         """MFA 토큰 검증"""
-        totp = pyotp.TOTP(secret)
-        return totp.verify(token, valid_window=1)
+        return get_totp(secret).verify(token, valid_window=1)
 
     async def create_user(self, username: str, email: str, password: str, role: UserRole) -> User:
         """사용자 생성"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            cursor_factory=RealDictCursor
-        )
-        
         try:
-            password_hash = self.hash_password(password)
-            
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO auth.users (username, email, password_hash, role)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING *
-                """, (username, email, password_hash, role.value))
-                
-                user_data = cursor.fetchone()
-                
-            conn.commit()
+            password_hash = await self.hash_password(password)
             
-            user = User(
-                id=user_data['id'],
-                username=user_data['username'],
-                email=user_data['email'],
-                password_hash=user_data['password_hash'],
-                role=UserRole(user_data['role']),
-                is_active=user_data['is_active'],
-                mfa_enabled=user_data['mfa_enabled'],
-                mfa_secret=user_data['mfa_secret'],
-                created_at=user_data['created_at'],
-                last_login=user_data['last_login'],
-                login_attempts=user_data['login_attempts'],
-                locked_until=user_data['locked_until']
+            user_data = await self._run_db(
+                'insert_user', (username, email, password_hash, role.value), fetch=True
             )
             
+            user = User(**{**user_data, 'role': UserRole(user_data['role'])})
+            
             logger.info(f"✅ 사용자 생성 완료: {username}")
             return user
             
         except Exception as e:
             logger.error(f"❌ 사용자 생성 실패: {str(e)}")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """사용자명으로 사용자 조회"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            cursor_factory=RealDictCursor
-        )
-        
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT * FROM auth.users WHERE username = %s AND is_active = TRUE
-                """, (username,))
-                
-                user_data = cursor.fetchone()
-                
+            user_data = await self._run_db('select_user', (username,), fetch=True)
+            
             if not user_data:
                 return None
                 
-            return User(
-                id=user_data['id'],
-                username=user_data['username'],
-                email=user_data['email'],
-                password_hash=user_data['password_hash'],
-                role=UserRole(user_data['role']),
-                is_active=user_data['is_active'],
-                mfa_enabled=user_data['mfa_enabled'],
-                mfa_secret=user_data['mfa_secret'],
-                created_at=user_data['created_at'],
-                last_login=user_data['last_login'],
-                login_attempts=user_data['login_attempts'],
-                locked_until=user_data['locked_until']
-            )
+            return User(**{**user_data, 'role': UserRole(user_data['role'])})
             
         except Exception as e:
             logger.error(f"❌ 사용자 조회 실패: {str(e)}")
             raise
-        finally:
-            conn.close()
 
     async def create_api_key(self, user_id: int, name: str, permissions: List[str], expires_at: Optional[datetime] = None) -> str:
         """API 키 생성"""
         api_key = self.generate_api_key()
         key_hash = self.hash_api_key(api_key)
         
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
-        
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO auth.api_keys (key_hash, name, user_id, permissions, expires_at)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (key_hash, name, user_id, json.dumps(permissions), expires_at))
-                
-            conn.commit()
+            await self._run_db(
+                'insert_api_key', (key_hash, name, user_id, orjson.dumps(permissions).decode(), expires_at)
+            )
+            
             logger.info(f"✅ API 키 생성 완료: {name}")
             return api_key
             
         except Exception as e:
             logger.error(f"❌ API 키 생성 실패: {str(e)}")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
+
+    async def validate_api_key(self, api_key: str) -> Optional[APIKey]:
+        """API 키 검증 (key_hash 유니크 인덱스 단건 조회 + 단기 캐시)"""
+        key_hash = self.hash_api_key(api_key)
+        now = time.time()
+        
+        cached = self.apikey_cache.get(key_hash)
+        if cached:
+            key, cache_expires_at = cached
+            if cache_expires_at > now and (key.expires_at is None or key.expires_at > datetime.utcnow()):
+                return key
+            del self.apikey_cache[key_hash]
+        
+        row = await self._run_db('select_api_key', (key_hash,), fetch=True)
+        
+        if not row:
+            return None
+        
+        key = APIKey(**row)
+        if len(self.apikey_cache) >= API_KEY_CACHE_MAX_SIZE:
+            del self.apikey_cache[next(iter(self.apikey_cache))]
+        self.apikey_cache[key_hash] = (key, now + API_KEY_CACHE_TTL)
+        return key
 
     async def log_security_event(self, event: SecurityEvent):
-        """보안 이벤트 로깅"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+        """보안 이벤트 로깅 (배치 저장 대기열에 추가)"""
+        if self._event_q.full():
+            self._event_q.get_nowait()
+            self.dropped_events += 1
+        self._event_q.put_nowait(event)
+
+    async def _record_login(self, name: str, event: SecurityEvent):
+        """로그인 결과 기록 (사용자 상태 갱신 + 보안 이벤트를 한 번의 DB 왕복으로)"""
+        try:
+            await self._run_db(name, (
+                event.user_id,
+                event.event_type.value,
+                event.ip_address,
+                event.user_agent,
+                orjson.dumps(event.details).decode()
+            ))
+        except Exception as e:
+            logger.error(f"❌ 로그인 결과 기록 실패: {str(e)}")
+
+    async def login_success_tx(self, event: SecurityEvent):
+        """로그인 성공: 실패 횟수 초기화, 마지막 로그인 갱신, 이벤트 기록"""
+        await self._record_login('login_success', event)
+
+    async def login_failure_tx(self, event: SecurityEvent):
+        """로그인 실패: 실패 횟수 증가, 이벤트 기록"""
+        await self._record_login('login_failure', event)
+
+    def _insert_events(self, events: List[SecurityEvent]) -> int:
+        """보안 이벤트 다중 행 INSERT 후 저장하지 못한 건수 반환 (스레드풀에서 호출)"""
+        records = [
+            (event.event_type.value, event.user_id, event.ip_address, event.user_agent, orjson.dumps(event.details).decode())
+            for event in events
+        ]
         
+        conn = self.db_pool.getconn()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO auth.security_events (event_type, user_id, ip_address, user_agent, details)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (
-                    event.event_type.value,
-                    event.user_id,
-                    event.ip_address,
-                    event.user_agent,
-                    json.dumps(event.details)
-                ))
-                
-            conn.commit()
+            try:
+                with conn.cursor() as cursor:
+                    execute_values(cursor, """
+                        INSERT INTO auth.security_events (event_type, user_id, ip_address, user_agent, details)
+                        VALUES %s
+                    """, records, page_size=len(records))
+                conn.commit()
+                return 0
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"⚠️ 보안 이벤트 배치 저장 실패, 행 단위로 재시도 ({len(records)}건): {str(e)}")
             
-        except Exception as e:
-            logger.error(f"❌ 보안 이벤트 로깅 실패: {str(e)}")
+            # 잘못된 행 하나로 배치 전체가 유실되지 않도록 행 단위 저장
+            dropped = 0
+            with conn.cursor() as cursor:
+                for record in records:
+                    try:
+                        cursor.execute("""
+                            INSERT INTO auth.security_events (event_type, user_id, ip_address, user_agent, details)
+                            VALUES (%s, %s, %s, %s, %s)
+                        """, record)
+                        conn.commit()
+                    except Exception as e:
+                        conn.rollback()
+                        dropped += 1
+                        logger.error(f"❌ 보안 이벤트 저장 실패 ({record[0]}): {str(e)}")
+            return dropped
         finally:
-            conn.close()
+            self.db_pool.putconn(conn)
+
+    async def _flush_events(self, events: List[SecurityEvent]):
+        """보안 이벤트 배치 저장"""
+        try:
+            self.dropped_events += await asyncio.get_running_loop().run_in_executor(
+                self.db_executor, self._insert_events, events
+            )
+        except Exception as e:
+            self.dropped_events += len(events)
+            logger.error(f"❌ 보안 이벤트 로깅 실패 ({len(events)}건): {str(e)}")
+
+    async def _event_flusher(self):
+        """보안 이벤트 배치 저장 루프 (최대 SECURITY_EVENT_FLUSH_INTERVAL 간격)"""
+        while True:
+            batch = [await self._event_q.get()]
+            if self._event_q.qsize() < SECURITY_EVENT_BATCH_SIZE:
+                await asyncio.sleep(SECURITY_EVENT_FLUSH_INTERVAL)
+            
+            while len(batch) < SECURITY_EVENT_BATCH_SIZE and not self._event_q.empty():
+                batch.append(self._event_q.get_nowait())
+            
+            await self._flush_events(batch)
 
     async def check_rate_limit(self, identifier: str, window: int = RATE_LIMIT_WINDOW, limit: int = RATE_LIMIT_REQUESTS) -> bool:
         """요청 속도 제한 확인"""
         try:
             key = f"rate_limit:{identifier}"
-            current = self.redis_client.get(key)
-            
-            if current is None:
-                self.redis_client.setex(key, window, 1)
-                return True
-            elif int(current) < limit:
-                self.redis_client.incr(key)
-                return True
-            else:
-                return False
-                
-        except Exception as e:
+            if self.rl_sha is None:
+                self.rl_sha = await self.redis_client.script_load(RATE_LIMIT_LUA)
+            
+            try:
+                count = await self.redis_client.evalsha(self.rl_sha, 1, key, window)
+            except redis.exceptions.NoScriptError:
+                # Redis 재시작/SCRIPT FLUSH로 스크립트 캐시가 비워진 경우 EVAL로 실행 후 재등록
+                count = await self.redis_client.eval(RATE_LIMIT_LUA, 1, key, window)
+                self.rl_sha = await self.redis_client.script_load(RATE_LIMIT_LUA)
+            
+            return int(count) <= limit
+        
+        except redis.RedisError as e:
             logger.error(f"❌ 속도 제한 확인 실패: {str(e)}")
             return True  # Redis 오류 시 허용
 
     def generate_jwt_token(self, user: User, token_type: str = "access") -> str:
         """JWT 토큰 생성"""
-        now = datetime.utcnow()
+        now = int(time.time())
         
         if token_type == "access":
-            expire = now + timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = now + JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
         else:  # refresh
-            expire = now + timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+            expire = now + JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
         
         payload = {
             "sub": str(user.id),
             "username": user.username,
             "role": user.role.value,
             "type": token_type,
-            "iat": now.timestamp(),
-            "exp": expire.timestamp(),
-            "jti": secrets.token_hex(16)
+            "iat": now,
+            "exp": expire,
+            "jti": secrets.token_urlsafe(16)  # 16바이트 base64url (22자)
         }
         
         return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
-    def verify_jwt_token(self, token: str) -> Dict:
+    def _cache_jwt(self, token_hash: bytes, payload: Dict):
+        """검증된 JWT 페이로드 캐시 (토큰 만료와 TTL 상한 중 이른 시각까지)"""
+        now = time.time()
+        expires_at = min(payload.get('exp', now), now + JWT_CACHE_TTL)
+        if expires_at <= now:
+            return
+        
+        if len(self.jwt_cache) >= JWT_CACHE_MAX_SIZE:
+            self._evict_jwt(next(iter(self.jwt_cache)))
+        
+        self.jwt_cache[token_hash] = (payload, expires_at)
+        if payload.get('jti'):
+            self.jwt_cache_jti[payload['jti']] = token_hash
+
+    def _evict_jwt(self, token_hash: bytes):
+        """JWT 캐시 항목 제거"""
+        entry = self.jwt_cache.pop(token_hash, None)
+        if entry:
+            self.jwt_cache_jti.pop(entry[0].get('jti'), None)
+
+    def _decode_jwt(self, token: str) -> Dict:
+        """HS256 서명 및 만료 검증 (PyJWT를 거치지 않는 빠른 경로)"""
+        try:
+            signing_input, _, signature = token.rpartition('.')
+            header_segment, _, payload_segment = signing_input.partition('.')
+            payload = orjson.loads(b64url_decode(payload_segment))
+        except ValueError as e:
+            raise jwt.DecodeError(str(e))
+        
+        if not isinstance(payload, dict) or not isinstance(payload.get('exp'), (int, float)):
+            raise jwt.DecodeError("Invalid payload")
+        
+        # 만료된 토큰은 HMAC 계산 전에 거부 (만료 토큰 재시도 비용 최소화)
+        if payload['exp'] <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        
+        try:
+            header = orjson.loads(b64url_decode(header_segment))
+            
+            mac = self._jwt_hmac.copy()
+            mac.update(signing_input.encode('ascii'))
+            signature_valid = hmac.compare_digest(mac.digest(), b64url_decode(signature))
+        except ValueError as e:
+            raise jwt.DecodeError(str(e))
+        
+        if not isinstance(header, dict) or header.get('alg') != JWT_ALGORITHM or not signature_valid:
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        
+        return payload
+
+    async def verify_jwt_token(self, token: str) -> Dict:
         """JWT 토큰 검증"""
+        token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        
         try:
-            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+            # 캐시는 서명/디코딩 결과만 재사용 (취소 여부는 다른 인스턴스 반영을 위해 매번 확인)
+            cached = self.jwt_cache.get(token_hash)
+            if cached and cached[1] > time.time():
+                payload = cached[0]
+            else:
+                if cached:
+                    self._evict_jwt(token_hash)
+                payload = self._decode_jwt(token)
+                self._cache_jwt(token_hash, payload)
+            
+            # 토큰 블랙리스트 및 사용자 단위 취소 확인
+            if await self.is_token_revoked(payload):
+                self._evict_jwt(token_hash)
+                raise jwt.InvalidTokenError("Token is revoked")
             
-            # 토큰 블랙리스트 확인
-            if self.is_token_blacklisted(payload.get('jti')):
-                raise jwt.InvalidTokenError("Token is blacklisted")
-                
             return payload
             
         except jwt.ExpiredSignatureError:
@@ -495,39 +804,49 @@ class SecurityManager:
         except jwt.InvalidTokenError:
             raise HTTPUnauthorized(reason="Invalid token")
 
-    def is_token_blacklisted(self, jti: str) -> bool:
-        """토큰 블랙리스트 확인"""
+    async def is_token_revoked(self, payload: Dict) -> bool:
+        """토큰 블랙리스트 및 사용자 단위 취소 확인 (단일 파이프라인 RTT)"""
         try:
-            return bool(self.redis_client.get(f"blacklist:{jti}"))
-        except:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(f"blacklist:{payload.get('jti')}")
+            pipe.get(f"user_revoked:{payload.get('sub')}")
+            blacklisted, user_revoked = await pipe.execute()
+            
+            # 사용자 취소 시각 이전에 발급된 토큰은 무효 (iat와 같은 초 단위로 비교, 취소 직후 재발급 토큰 허용)
+            return bool(blacklisted) or (user_revoked is not None and payload.get('iat', 0) < int(float(user_revoked)))
+        except redis.RedisError as e:
+            logger.error(f"❌ 토큰 취소 여부 확인 실패: {str(e)}")
             return False
 
+    async def revoke_user_tokens(self, user_id: int):
+        """사용자의 기존 토큰 전체 취소"""
+        sub = str(user_id)
+        for token_hash, (payload, _) in list(self.jwt_cache.items()):
+            if payload.get('sub') == sub:
+                self._evict_jwt(token_hash)
+        
+        try:
+            await self.redis_client.setex(
+                f"user_revoked:{sub}", JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400, int(time.time())
+            )
+        except redis.RedisError as e:
+            logger.error(f"❌ 사용자 토큰 취소 실패: {str(e)}")
+
     async def revoke_token(self, jti: str, expires_at: datetime):
         """토큰 취소"""
+        # 캐시된 검증 결과 즉시 무효화
+        token_hash = self.jwt_cache_jti.get(jti)
+        if token_hash:
+            self._evict_jwt(token_hash)
+        
         try:
             # Redis에 블랙리스트 추가
-            ttl = int((expires_at - datetime.utcnow()).total_seconds())
+            ttl = int(expires_at.replace(tzinfo=timezone.utc).timestamp() - time.time())
             if ttl > 0:
-                self.redis_client.setex(f"blacklist:{jti}", ttl, "1")
+                await self.redis_client.setex(f"blacklist:{jti}", ttl, "1")
                 
             # 데이터베이스에도 기록
-            conn = psycopg2.connect(
-                host=POSTGRES_HOST,
-                port=POSTGRES_PORT,
-                database=POSTGRES_DB,
-                user=POSTGRES_USER,
-                password=POSTGRES_PASSWORD
-            )
-            
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO auth.token_blacklist (token_jti, expires_at)
-                    VALUES (%s, %s)
-                    ON CONFLICT (token_jti) DO NOTHING
-                """, (jti, expires_at))
-                
-            conn.commit()
-            conn.close()
+            await self._run_db('insert_blacklist', (jti, expires_at))
             
         except Exception as e:
             logger.error(f"❌ 토큰 취소 실패: {str(e)}")
@@ -591,8 +910,8 @@ class AuthHandler:
                 raise HTTPForbidden(reason="Account locked")
             
             # 비밀번호 검증
-            if not self.security_manager.verify_password(password, user.password_hash):
-                await self.security_manager.log_security_event(SecurityEvent(
+            if not await self.security_manager.verify_password(password, user.password_hash):
+                await self.security_manager.login_failure_tx(SecurityEvent(
                     id=None,
                     event_type=SecurityEventType.LOGIN_FAILURE,
                     user_id=user.id,
@@ -622,8 +941,8 @@ class AuthHandler:
             access_token = self.security_manager.generate_jwt_token(user, "access")
             refresh_token = self.security_manager.generate_jwt_token(user, "refresh")
             
-            # 성공 로깅
-            await self.security_manager.log_security_event(SecurityEvent(
+            # 성공 로깅 (사용자 로그인 상태 갱신 포함)
+            await self.security_manager.login_success_tx(SecurityEvent(
                 id=None,
                 event_type=SecurityEventType.LOGIN_SUCCESS,
                 user_id=user.id,
@@ -661,7 +980,7 @@ class AuthHandler:
                 raise HTTPBadRequest(reason="Refresh token required")
             
             # 토큰 검증
-            payload = self.security_manager.verify_jwt_token(refresh_token)
+            payload = await self.security_manager.verify_jwt_token(refresh_token)
             
             if payload.get('type') != 'refresh':
                 raise HTTPUnauthorized(reason="Invalid token type")
@@ -705,7 +1024,7 @@ class AuthHandler:
                 raise HTTPBadRequest(reason="Invalid authorization header")
             
             token = auth_header[7:]  # "Bearer " 제거
-            payload = self.security_manager.verify_jwt_token(token)
+            payload = await self.security_manager.verify_jwt_token(token)
             
             # 토큰 취소
             exp_timestamp = payload.get('exp')
@@ -731,13 +1050,29 @@ class AuthHandler:
             logger.error(f"❌ 로그아웃 처리 실패: {str(e)}")
             raise web.HTTPInternalServerError(reason="Internal server error")
 
+    async def mfa_qr_code(self, request):
+        """MFA QR 코드 PNG"""
+        try:
+            user = await self.security_manager.get_user_by_username(request['user']['username'])
+            if not user or not user.mfa_secret:
+                raise web.HTTPNotFound(reason="MFA not configured")
+            
+            png = self.security_manager.generate_mfa_qr_code(user.username, user.mfa_secret)
+            return web.Response(body=png, content_type='image/png', headers={'Cache-Control': 'no-store'})
+            
+        except web.HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"❌ MFA QR 코드 생성 실패: {str(e)}")
+            raise web.HTTPInternalServerError(reason="Internal server error")
+
+# 인증이 필요 없는 경로 (로그아웃은 핸들러에서 직접 토큰 검증)
+PUBLIC_PATHS = frozenset({'/auth/login', '/auth/refresh', '/auth/logout', '/health', '/docs'})
+
 # 미들웨어
 async def auth_middleware(request, handler):
     """인증 미들웨어"""
-    # 인증이 필요 없는 경로
-    public_paths = ['/auth/login', '/auth/refresh', '/health', '/docs']
-    
-    if request.path in public_paths or request.path.startswith('/auth/'):
+    if request.path in PUBLIC_PATHS:
         return await handler(request)
     
     # Authorization 헤더 확인
@@ -749,7 +1084,7 @@ async def auth_middleware(request, handler):
     
     try:
         security_manager = request.app['security_manager']
-        payload = security_manager.verify_jwt_token(token)
+        payload = await security_manager.verify_jwt_token(token)
         
         # 요청에 사용자 정보 추가
         request['user'] = {
@@ -758,11 +1093,12 @@ async def auth_middleware(request, handler):
             'role': payload.get('role')
         }
         
-        return await handler(request)
-        
     except Exception as e:
         logger.error(f"❌ 인증 미들웨어 오류: {str(e)}")
         raise HTTPUnauthorized(reason="Invalid token")
+    
+    # 핸들러 예외(404/500 등)는 401로 바꾸지 않고 그대로 전달
+    return await handler(request)
 
 async def create_app():
     """애플리케이션 생성"""
@@ -773,6 +1109,11 @@ async def create_app():
     await security_manager.initialize()
     app['security_manager'] = security_manager
     
+    async def close_security_manager(app):
+        await app['security_manager'].close()
+    
+    app.on_cleanup.append(close_security_manager)
+    
     # 인증 핸들러
     auth_handler = AuthHandler(security_manager)
     
@@ -780,6 +1121,7 @@ async def create_app():
     app.router.add_post('/auth/login', auth_handler.login)
     app.router.add_post('/auth/refresh', auth_handler.refresh_token)
     app.router.add_post('/auth/logout', auth_handler.logout)
+    app.router.add_get('/auth/mfa/qr', auth_handler.mfa_qr_code)
     
     # 헬스체크
     async def health_check(request):
@@ -16,7 +16,7 @@ import asyncio
 import os
 import secrets
 import hashlib
-import json
+import orjson
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
@@ -24,11 +24,21 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import base64
 import hmac
+import time
+import threading
+import csv
+import io
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # 암호화 라이브러리
 from cryptography.hazmat.primitives import hashes, serialization, padding
 from cryptography.hazmat.primitives.asymmetric import rsa, padding as asym_padding
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap_with_padding, aes_key_unwrap_with_padding
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.backends import default_backend
@@ -36,6 +46,8 @@ from cryptography.x509 import load_pem_x509_certificate, CertificateBuilder, Nam
 from cryptography.x509.oid import NameOID, ExtensionOID
 from cryptography import x509
 import psycopg2
+import psycopg2.pool
+import psycopg2.extensions
 from psycopg2.extras import RealDictCursor
 import redis
 
@@ -45,6 +57,8 @@ POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'smarttire_sensors')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'smarttire')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'password')
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', '2'))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '32'))
 
 REDIS_HOST = os.getenv('REDIS_HOST', 'redis-service')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
@@ -54,6 +68,31 @@ REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
 MASTER_KEY = os.getenv('MASTER_KEY', secrets.token_hex(32))
 KEY_ROTATION_DAYS = int(os.getenv('KEY_ROTATION_DAYS', '90'))
 HSM_ENABLED = os.getenv('HSM_ENABLED', 'false').lower() == 'true'
+# 신규 서명 키 알고리즘 (rsa_2048: 외부 호환, ed25519: 디바이스 텔레메트리용 고속 서명)
+SIGNING_KEY_ALGORITHM = os.getenv('SIGNING_KEY_ALGORITHM', 'rsa_2048')
+
+# AES-NI/PCLMULQDQ 가속 확인용 기준 (가속 빌드는 1 ns/byte 미만, 소프트웨어 구현은 수 ns/byte)
+AES_GCM_PROBE_BYTES = 1 << 20
+AES_GCM_MAX_NS_PER_BYTE = float(os.getenv('AES_GCM_MAX_NS_PER_BYTE', '1.5'))
+
+# 키 캐시 (DB 행 및 마스터 키로 복호화된 키 바이트)
+KEY_CACHE_MAX_SIZE = int(os.getenv('KEY_CACHE_MAX_SIZE', '256'))
+KEY_CACHE_TTL = int(os.getenv('KEY_CACHE_TTL', '60'))  # 초
+
+# 역직렬화된 서명 키 객체 캐시 (PEM 파싱 생략)
+SIGNING_KEY_CACHE_MAX_SIZE = int(os.getenv('SIGNING_KEY_CACHE_MAX_SIZE', '128'))
+SIGNING_KEY_CACHE_TTL = int(os.getenv('SIGNING_KEY_CACHE_TTL', '300'))  # 초
+
+# 암호화 작업 로그 배치 저장 (COPY)
+CRYPTO_LOG_QUEUE_SIZE = int(os.getenv('CRYPTO_LOG_QUEUE_SIZE', '10000'))
+CRYPTO_LOG_BATCH_SIZE = int(os.getenv('CRYPTO_LOG_BATCH_SIZE', '1000'))
+CRYPTO_LOG_FLUSH_INTERVAL = float(os.getenv('CRYPTO_LOG_FLUSH_INTERVAL', '0.1'))  # 초
+
+# 스레드별 재사용 암/복호화 출력 버퍼 최대 크기 (초과 시 호출마다 할당)
+CIPHER_BUFFER_MAX_BYTES = int(os.getenv('CIPHER_BUFFER_MAX_BYTES', str(64 * 1024)))
+GCM_TAG_SIZE = 16
+
+KEYGEN_POOL_SIZE = int(os.getenv('KEYGEN_POOL_SIZE', '2'))
 
 # 로깅 설정
 logging.basicConfig(
@@ -68,6 +107,7 @@ class KeyType(Enum):
     DATA_ENCRYPTION_KEY = "data_encryption_key"
     KEY_ENCRYPTION_KEY = "key_encryption_key"
     SIGNING_KEY = "signing_key"
+    MAC_KEY = "mac_key"
     TLS_CERTIFICATE = "tls_certificate"
     DEVICE_CERTIFICATE = "device_certificate"
 
@@ -79,6 +119,8 @@ class EncryptionAlgorithm(Enum):
     RSA_4096 = "rsa_4096"
     ECDSA_P256 = "ecdsa_p256"
     ECDSA_P384 = "ecdsa_p384"
+    ED25519 = "ed25519"
+    HMAC_SHA256 = "hmac_sha256"
 
 class KeyStatus(Enum):
     """키 상태"""
@@ -102,6 +144,8 @@ class CryptoKey:
     expires_at: Optional[datetime]
     rotated_from: Optional[str]
     metadata: Dict = None
+    wrap_tag: Optional[bytes] = None  # 마스터 키 GCM 태그
+    public_key: Optional[bytes] = None  # 서명 키 공개키 (PEM)
 
 @dataclass
 class EncryptedData:
@@ -121,16 +165,133 @@ class DigitalSignature:
     key_id: str
     timestamp: datetime
 
+# 연결당 한 번 PREPARE하는 핫패스 문장 (이름 -> SQL)
+PREPARED_STATEMENTS = {
+    'select_key_by_id': """
+        SELECT * FROM security.crypto_keys
+        WHERE key_id = $1 AND status = 'active'
+    """,
+    'select_key_by_type': """
+        SELECT * FROM security.crypto_keys
+        WHERE key_type = $1 AND status = 'active'
+        ORDER BY created_at DESC
+        LIMIT 1
+    """,
+    'update_key_status': """
+        UPDATE security.crypto_keys
+        SET status = $1
+        WHERE key_id = $2
+    """,
+}
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """세션에 PREPARE된 문장 이름을 추적하는 연결"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+class TTLCache:
+    """크기 제한 및 만료 시간이 있는 LRU 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        """캐시 조회 (만료 항목은 제거 후 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        if entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def set(self, key, value):
+        """캐시 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key):
+        """캐시 항목 제거"""
+        self._data.pop(key, None)
+
+_cipher_buffers = threading.local()
+
+def _cipher_buffer(size: int) -> bytearray:
+    """스레드별 재사용 출력 버퍼 (2의 거듭제곱 크기로 증가)"""
+    if size > CIPHER_BUFFER_MAX_BYTES:
+        return bytearray(size)
+    
+    buf = getattr(_cipher_buffers, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(1 << (size - 1).bit_length())
+        _cipher_buffers.buf = buf
+    return buf
+
+def _apply_cipher(ctx, data: bytes) -> bytes:
+    """update_into로 단일 버퍼에 암/복호화 후 finalize (update() + finalize() 연결 할당 제거)"""
+    size = len(data) + algorithms.AES.block_size // 8 - 1
+    buf = _cipher_buffer(size)
+    try:
+        n = ctx.update_into(data, buf)
+        ctx.finalize()
+        return bytes(memoryview(buf)[:n])
+    finally:
+        # 재사용 버퍼에 키/평문이 남지 않도록 사용 영역 초기화 (태그 검증 실패 시 포함)
+        buf[:size] = bytes(size)
+
+def _generate_rsa_key(bits: int) -> bytes:
+    """RSA 개인키 생성 후 PKCS8 PEM 반환 (프로세스 풀에서 호출, 키 객체는 pickle 불가)"""
+    private_key = rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=bits,
+        backend=default_backend()
+    )
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
 class CryptoManager:
     """암호화 관리자"""
     
     def __init__(self):
         self.redis_client = None
+        self.connection_pool = None
+        # 블로킹 psycopg2 호출을 이벤트 루프 밖에서 실행 (풀 최대 연결 수와 동일)
+        self.executor = ThreadPoolExecutor(max_workers=DB_POOL_MAX_SIZE)
+        # RSA 키 생성용 프로세스 풀 (initialize에서 생성)
+        self._keygen_pool = None
         self.master_key = MASTER_KEY.encode() if isinstance(MASTER_KEY, str) else MASTER_KEY
-        self._key_cache = {}
+        self._key_cache = TTLCache(KEY_CACHE_MAX_SIZE, KEY_CACHE_TTL)
+        # 마스터 키로 복호화된 키 바이트 (데이터 작업마다 마스터 키 GCM 복호화 생략)
+        self._plain_key_cache = TTLCache(KEY_CACHE_MAX_SIZE, KEY_CACHE_TTL)
+        # 키별 AES-GCM 컨텍스트 (키 스케줄/GHASH 서브키 재사용)
+        self._aead_cache = TTLCache(KEY_CACHE_MAX_SIZE, KEY_CACHE_TTL)
+        self._private_key_cache = TTLCache(SIGNING_KEY_CACHE_MAX_SIZE, SIGNING_KEY_CACHE_TTL)
+        self._public_key_cache = TTLCache(SIGNING_KEY_CACHE_MAX_SIZE, SIGNING_KEY_CACHE_TTL)
+        # 암호화 작업 로그 대기열 (가득 차면 폐기 후 카운트)
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=CRYPTO_LOG_QUEUE_SIZE)
+        self._log_task = None
+        self.dropped_logs = 0
         
     async def initialize(self):
         """초기화"""
+        # RSA 키 생성 프로세스 풀 (스레드 시작 전 생성, 멀티스레드 프로세스 fork 시 락 교착 방지를 위해 forkserver 사용)
+        self._keygen_pool = ProcessPoolExecutor(
+            max_workers=KEYGEN_POOL_SIZE,
+            mp_context=multiprocessing.get_context('forkserver')
+        )
+        
         # Redis 연결
         self.redis_client = redis.Redis(
             host=REDIS_HOST,
@@ -139,24 +300,120 @@ class CryptoManager:
             decode_responses=False  # 바이너리 데이터 처리
         )
         
+        # 데이터베이스 연결 풀 (키 조회마다 연결/인증 핸드셰이크 방지)
+        self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
+            DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE,
+            host=POSTGRES_HOST,
+            port=POSTGRES_PORT,
+            database=POSTGRES_DB,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            connection_factory=PreparedConnection
+        )
+        
+        # OpenSSL AES-GCM 하드웨어 가속 확인
+        self.check_aes_acceleration()
+        
         # 테이블 생성
         await self.create_crypto_tables()
         
         # 마스터 키 검증
         await self.verify_master_key()
         
+        # 암호화 작업 로그 배치 저장 태스크 시작
+        self._log_task = asyncio.create_task(self._log_flusher())
+        
         # 기본 키 생성
         await self.initialize_default_keys()
 
+    def get_connection(self):
+        """연결 풀에서 연결 획득"""
+        return self.connection_pool.getconn()
+
+    def return_connection(self, conn):
+        """연결 풀에 연결 반환"""
+        self.connection_pool.putconn(conn)
+
+    async def close(self):
+        """연결 풀 정리"""
+        if self._log_task:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            
+            # 남은 로그 저장
+            remaining = []
+            while not self._log_queue.empty():
+                remaining.append(self._log_queue.get_nowait())
+            if remaining:
+                await self._flush_logs(remaining)
+        
+        if self.connection_pool:
+            self.connection_pool.closeall()
+        self.executor.shutdown(wait=False)
+        if self._keygen_pool:
+            self._keygen_pool.shutdown(wait=False)
+
+    def _execute(self, name: str, params: tuple, fetch: bool = False) -> Optional[Dict]:
+        """풀 연결로 준비된 문장 실행 및 커밋 (스레드풀에서 호출)"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                # 연결당 한 번만 PREPARE (이후 EXECUTE는 파싱/플래닝 생략)
+                if name not in conn.prepared_statements:
+                    cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+                    conn.prepared_statements.add(name)
+                
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+                row = cursor.fetchone() if fetch else None
+            conn.commit()
+            return row
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
+    async def _run_db(self, name: str, params: tuple, fetch: bool = False) -> Optional[Dict]:
+        """블로킹 DB 작업을 스레드풀에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self._execute, name, params, fetch
+        )
+
+    def check_aes_acceleration(self) -> float:
+        """OpenSSL 버전 및 AES-256-GCM 처리 속도 확인 (AES-NI/PCLMULQDQ 미사용 빌드 감지)"""
+        backend = default_backend()
+        logger.info(f"🔐 OpenSSL: {backend.openssl_version_text()}")
+        
+        data = bytes(AES_GCM_PROBE_BYTES)
+        key = os.urandom(32)
+        
+        # 첫 호출 초기화 비용 제외
+        warmup = Cipher(algorithms.AES(key), modes.GCM(os.urandom(12)), backend=backend).encryptor()
+        warmup.update(data[:4096])
+        warmup.finalize()
+        
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(os.urandom(12)), backend=backend).encryptor()
+        start = time.perf_counter_ns()
+        encryptor.update(data)
+        encryptor.finalize()
+        ns_per_byte = (time.perf_counter_ns() - start) / len(data)
+        
+        if ns_per_byte > AES_GCM_MAX_NS_PER_BYTE:
+            logger.warning(
+                f"⚠️ AES-256-GCM 처리 속도 저하 ({ns_per_byte:.2f} ns/byte): "
+                f"OpenSSL이 AES-NI/PCLMULQDQ 없이 빌드되었을 수 있음"
+            )
+        else:
+            logger.info(f"✅ AES-256-GCM 하드웨어 가속 확인 ({ns_per_byte:.2f} ns/byte)")
+        
+        return ns_per_byte
+
     async def create_crypto_tables(self):
         """암호화 관련 테이블 생성"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+        conn = self.get_connection()
         
         try:
             with conn.cursor() as cursor:
@@ -177,6 +434,13 @@ class CryptoManager:
                     )
                 """)
                 
+                # 마스터 키 GCM 태그 및 공개키 전용 컬럼 (조회마다 JSON/base64 디코딩 방지)
+                cursor.execute("""
+                    ALTER TABLE security.crypto_keys
+                    ADD COLUMN IF NOT EXISTS wrap_tag BYTEA,
+                    ADD COLUMN IF NOT EXISTS public_key BYTEA
+                """)
+                
                 # 암호화 작업 로그 테이블
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS security.crypto_operations (
@@ -192,6 +456,12 @@ class CryptoManager:
                     )
                 """)
                 
+                # 배치 작업 건수 (단건 작업은 1)
+                cursor.execute("""
+                    ALTER TABLE security.crypto_operations
+                    ADD COLUMN IF NOT EXISTS item_count INTEGER NOT NULL DEFAULT 1
+                """)
+                
                 # 인증서 테이블
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS security.certificates (
@@ -213,6 +483,7 @@ class CryptoManager:
                 # 인덱스 생성
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_crypto_keys_key_id ON security.crypto_keys(key_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_crypto_keys_type ON security.crypto_keys(key_type)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_keys_active_expiring ON security.crypto_keys(expires_at) WHERE status = 'active'")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_crypto_operations_timestamp ON security.crypto_operations(timestamp)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_certificates_cert_id ON security.certificates(cert_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_certificates_status ON security.certificates(status)")
@@ -225,7 +496,7 @@ class CryptoManager:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self.return_connection(conn)
 
     async def verify_master_key(self):
         """마스터 키 검증"""
@@ -273,21 +544,20 @@ class CryptoManager:
         key_id = f"dek_{secrets.token_hex(16)}"
         key_data = os.urandom(32)  # 256비트 키
         
-        # 마스터 키로 암호화
-        encrypted_key = await self.encrypt_with_master_key(key_data)
+        # 마스터 키로 래핑 (AES-KW)
+        wrapped_key = await self.wrap_with_master_key(key_data)
         
         crypto_key = CryptoKey(
             id=None,
             key_id=key_id,
             key_type=KeyType.DATA_ENCRYPTION_KEY,
             algorithm=EncryptionAlgorithm.AES_256_GCM,
-            key_data=encrypted_key.ciphertext,
-            iv=encrypted_key.iv,
+            key_data=wrapped_key,
+            iv=None,
             status=KeyStatus.ACTIVE,
             created_at=datetime.utcnow(),
             expires_at=datetime.utcnow() + timedelta(days=KEY_ROTATION_DAYS),
-            rotated_from=None,
-            metadata={"tag": base64.b64encode(encrypted_key.tag).decode() if encrypted_key.tag else None}
+            rotated_from=None
         )
         
         await self.store_key(crypto_key)
@@ -299,47 +569,54 @@ class CryptoManager:
         key_id = f"kek_{secrets.token_hex(16)}"
         key_data = os.urandom(32)  # 256비트 키
         
-        # 마스터 키로 암호화
-        encrypted_key = await self.encrypt_with_master_key(key_data)
+        # 마스터 키로 래핑 (AES-KW)
+        wrapped_key = await self.wrap_with_master_key(key_data)
         
         crypto_key = CryptoKey(
             id=None,
             key_id=key_id,
             key_type=KeyType.KEY_ENCRYPTION_KEY,
             algorithm=EncryptionAlgorithm.AES_256_GCM,
-            key_data=encrypted_key.ciphertext,
-            iv=encrypted_key.iv,
+            key_data=wrapped_key,
+            iv=None,
             status=KeyStatus.ACTIVE,
             created_at=datetime.utcnow(),
             expires_at=datetime.utcnow() + timedelta(days=KEY_ROTATION_DAYS),
-            rotated_from=None,
-            metadata={"tag": base64.b64encode(encrypted_key.tag).decode() if encrypted_key.tag else None}
+            rotated_from=None
         )
         
         await self.store_key(crypto_key)
         logger.info(f"✅ 키 암호화 키 생성 완료: {key_id}")
         return key_id
 
-    async def generate_signing_key(self) -> str:
+    async def generate_signing_key(self, algorithm: Optional[EncryptionAlgorithm] = None) -> str:
         """서명 키 생성"""
+        algorithm = algorithm or EncryptionAlgorithm(SIGNING_KEY_ALGORITHM)
         key_id = f"sign_{secrets.token_hex(16)}"
         
-        # RSA 키 쌍 생성
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-            backend=default_backend()
-        )
-        
-        # 개인키 직렬화
-        private_key_bytes = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        )
+        if algorithm == EncryptionAlgorithm.ED25519:
+            # Ed25519 키 쌍 생성 (개인키는 32바이트 raw 형식)
+            private_key = Ed25519PrivateKey.generate()
+            private_key_bytes = private_key.private_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PrivateFormat.Raw,
+                encryption_algorithm=serialization.NoEncryption()
+            )
+        elif algorithm == EncryptionAlgorithm.RSA_2048:
+            # RSA 키 쌍 생성 (이벤트 루프 차단 방지를 위해 별도 프로세스에서 실행)
+            private_key_bytes = await asyncio.get_running_loop().run_in_executor(
+                self._keygen_pool, _generate_rsa_key, 2048
+            )
+            private_key = serialization.load_pem_private_key(
+                private_key_bytes,
+                password=None,
+                backend=default_backend()
+            )
+        else:
+            raise ValueError(f"Unsupported signing algorithm: {algorithm}")
         
-        # 마스터 키로 암호화
-        encrypted_key = await self.encrypt_with_master_key(private_key_bytes)
+        # 마스터 키로 래핑 (AES-KW)
+        wrapped_key = await self.wrap_with_master_key(private_key_bytes)
         
         # 공개키 저장을 위한 메타데이터
         public_key = private_key.public_key()
@@ -352,23 +629,45 @@ class CryptoManager:
             id=None,
             key_id=key_id,
             key_type=KeyType.SIGNING_KEY,
-            algorithm=EncryptionAlgorithm.RSA_2048,
-            key_data=encrypted_key.ciphertext,
-            iv=encrypted_key.iv,
+            algorithm=algorithm,
+            key_data=wrapped_key,
+            iv=None,
             status=KeyStatus.ACTIVE,
             created_at=datetime.utcnow(),
             expires_at=datetime.utcnow() + timedelta(days=KEY_ROTATION_DAYS),
             rotated_from=None,
-            metadata={
-                "tag": base64.b64encode(encrypted_key.tag).decode() if encrypted_key.tag else None,
-                "public_key": base64.b64encode(public_key_bytes).decode()
-            }
+            public_key=public_key_bytes
         )
         
         await self.store_key(crypto_key)
         logger.info(f"✅ 서명 키 생성 완료: {key_id}")
         return key_id
 
+    async def generate_mac_key(self) -> str:
+        """메시지 인증(HMAC) 키 생성"""
+        key_id = f"mac_{secrets.token_hex(16)}"
+        key_data = os.urandom(32)  # 256비트 키
+        
+        # 마스터 키로 래핑 (AES-KW)
+        wrapped_key = await self.wrap_with_master_key(key_data)
+        
+        crypto_key = CryptoKey(
+            id=None,
+            key_id=key_id,
+            key_type=KeyType.MAC_KEY,
+            algorithm=EncryptionAlgorithm.HMAC_SHA256,
+            key_data=wrapped_key,
+            iv=None,
+            status=KeyStatus.ACTIVE,
+            created_at=datetime.utcnow(),
+            expires_at=datetime.utcnow() + timedelta(days=KEY_ROTATION_DAYS),
+            rotated_from=None
+        )
+        
+        await self.store_key(crypto_key)
+        logger.info(f"✅ 메시지 인증 키 생성 완료: {key_id}")
+        return key_id
+
     async def encrypt_with_master_key(self, data: bytes) -> EncryptedData:
         """마스터 키로 데이터 암호화"""
         iv = os.urandom(12)  # GCM 모드용 96비트 IV
@@ -380,7 +679,7 @@ class CryptoManager:
         )
         
         encryptor = cipher.encryptor()
-        ciphertext = encryptor.update(data) + encryptor.finalize()
+        ciphertext = _apply_cipher(encryptor, data)
         
         return EncryptedData(
             ciphertext=ciphertext,
@@ -400,7 +699,77 @@ class CryptoManager:
         )
         
         decryptor = cipher.decryptor()
-        return decryptor.update(ciphertext) + decryptor.finalize()
+        return _apply_cipher(decryptor, ciphertext)
+
+    async def wrap_with_master_key(self, key_data: bytes) -> bytes:
+        """마스터 키로 키 래핑 (AES-KW, IV/태그 저장 불필요)"""
+        return aes_key_wrap_with_padding(self.master_key, key_data, backend=default_backend())
+
+    async def unwrap_with_master_key(self, wrapped_key: bytes) -> bytes:
+        """마스터 키로 래핑된 키 복원"""
+        return aes_key_unwrap_with_padding(self.master_key, wrapped_key, backend=default_backend())
+
+    def _key_tag(self, crypto_key: CryptoKey) -> bytes:
+        """마스터 키 암호화 GCM 태그"""
+        return crypto_key.wrap_tag or b""
+
+    async def _decrypt_key_material(self, crypto_key: CryptoKey) -> bytes:
+        """저장된 키 복원 (IV가 없으면 AES-KW, 있으면 기존 GCM 래핑 키)"""
+        if crypto_key.iv is None:
+            return await self.unwrap_with_master_key(crypto_key.key_data)
+        return await self.decrypt_with_master_key(crypto_key.key_data, crypto_key.iv, self._key_tag(crypto_key))
+
+    async def _unwrap_key(self, crypto_key: CryptoKey) -> bytes:
+        """마스터 키로 암호화된 키 복호화 (복호화된 키 캐시 사용)"""
+        plain_key = self._plain_key_cache.get(crypto_key.key_id)
+        if plain_key is None:
+            plain_key = await self._decrypt_key_material(crypto_key)
+            self._plain_key_cache.set(crypto_key.key_id, plain_key)
+        return plain_key
+
+    async def _get_aead(self, crypto_key: CryptoKey) -> AESGCM:
+        """키별 AES-GCM 암호화기 조회 (메시지마다 IV만 교체)"""
+        aead = self._aead_cache.get(crypto_key.key_id)
+        if aead is None:
+            aead = AESGCM(await self._unwrap_key(crypto_key))
+            self._aead_cache.set(crypto_key.key_id, aead)
+        return aead
+
+    async def _load_private_key(self, signing_key: CryptoKey):
+        """서명 개인키 역직렬화 (키 객체 캐시 사용)"""
+        private_key = self._private_key_cache.get(signing_key.key_id)
+        if private_key is None:
+            private_key_bytes = await self._decrypt_key_material(signing_key)
+            if signing_key.algorithm == EncryptionAlgorithm.ED25519:
+                private_key = Ed25519PrivateKey.from_private_bytes(private_key_bytes)
+            else:
+                private_key = serialization.load_pem_private_key(
+                    private_key_bytes,
+                    password=None,
+                    backend=default_backend()
+                )
+            self._private_key_cache.set(signing_key.key_id, private_key)
+            self._public_key_cache.set(signing_key.key_id, private_key.public_key())
+        return private_key
+
+    def _load_public_key(self, signing_key: CryptoKey):
+        """서명 공개키 역직렬화 (키 객체 캐시 사용)"""
+        public_key = self._public_key_cache.get(signing_key.key_id)
+        if public_key is None:
+            public_key = serialization.load_pem_public_key(
+                signing_key.public_key,
+                backend=default_backend()
+            )
+            self._public_key_cache.set(signing_key.key_id, public_key)
+        return public_key
+
+    def _invalidate_key(self, key_id: str):
+        """키 캐시 무효화"""
+        self._key_cache.pop(key_id)
+        self._plain_key_cache.pop(key_id)
+        self._aead_cache.pop(key_id)
+        self._private_key_cache.pop(key_id)
+        self._public_key_cache.pop(key_id)
 
     async def encrypt_data(self, data: bytes, key_id: Optional[str] = None) -> EncryptedData:
         """데이터 암호화"""
@@ -419,23 +788,13 @@ class CryptoManager:
             if not dek:
                 raise ValueError(f"Encryption key not found: {key_id}")
             
-            # 키 복호화
-            decrypted_key = await self.decrypt_with_master_key(
-                dek.key_data,
-                dek.iv,
-                base64.b64decode(dek.metadata.get("tag", "")) if dek.metadata and dek.metadata.get("tag") else b""
-            )
+            # 키별 암호화기 조회
+            aead = await self._get_aead(dek)
             
-            # 데이터 암호화
+            # 데이터 암호화 (출력 = 암호문 || 16바이트 태그)
             iv = os.urandom(12)
-            cipher = Cipher(
-                algorithms.AES(decrypted_key),
-                modes.GCM(iv),
-                backend=default_backend()
-            )
-            
-            encryptor = cipher.encryptor()
-            ciphertext = encryptor.update(data) + encryptor.finalize()
+            sealed = aead.encrypt(iv, data, None)
+            ciphertext, tag = sealed[:-GCM_TAG_SIZE], sealed[-GCM_TAG_SIZE:]
             
             # 작업 로그
             await self.log_crypto_operation("encrypt", key_id, len(data), None, None, True)
@@ -443,7 +802,7 @@ class CryptoManager:
             return EncryptedData(
                 ciphertext=ciphertext,
                 iv=iv,
-                tag=encryptor.tag,
+                tag=tag,
                 key_id=key_id,
                 algorithm=dek.algorithm,
                 timestamp=datetime.utcnow()
@@ -462,22 +821,11 @@ class CryptoManager:
             if not dek:
                 raise ValueError(f"Decryption key not found: {encrypted_data.key_id}")
             
-            # 키 복호화
-            decrypted_key = await self.decrypt_with_master_key(
-                dek.key_data,
-                dek.iv,
-                base64.b64decode(dek.metadata.get("tag", "")) if dek.metadata and dek.metadata.get("tag") else b""
-            )
+            # 키별 암호화기 조회
+            aead = await self._get_aead(dek)
             
             # 데이터 복호화
-            cipher = Cipher(
-                algorithms.AES(decrypted_key),
-                modes.GCM(encrypted_data.iv, encrypted_data.tag),
-                backend=default_backend()
-            )
-            
-            decryptor = cipher.decryptor()
-            plaintext = decryptor.update(encrypted_data.ciphertext) + decryptor.finalize()
+            plaintext = aead.decrypt(encrypted_data.iv, encrypted_data.ciphertext + encrypted_data.tag, None)
             
             # 작업 로그
             await self.log_crypto_operation("decrypt", encrypted_data.key_id, len(plaintext), None, None, True)
@@ -489,6 +837,82 @@ class CryptoManager:
             logger.error(f"❌ 데이터 복호화 실패: {str(e)}")
             raise
 
+    async def encrypt_many(self, items: List[bytes], key_id: Optional[str] = None) -> List[EncryptedData]:
+        """데이터 일괄 암호화 (키 조회/복호화 1회, 항목별 IV)"""
+        total_size = sum(len(item) for item in items)
+        try:
+            # 기본 DEK 사용
+            if not key_id:
+                dek = await self.get_key_by_type(KeyType.DATA_ENCRYPTION_KEY)
+                if not dek:
+                    key_id = await self.generate_data_encryption_key()
+                    dek = await self.get_key_by_id(key_id)
+                else:
+                    key_id = dek.key_id
+            else:
+                dek = await self.get_key_by_id(key_id)
+            
+            if not dek:
+                raise ValueError(f"Encryption key not found: {key_id}")
+            
+            aead = await self._get_aead(dek)
+            timestamp = datetime.utcnow()
+            
+            results = []
+            for item in items:
+                iv = os.urandom(12)
+                sealed = aead.encrypt(iv, item, None)
+                results.append(EncryptedData(
+                    ciphertext=sealed[:-GCM_TAG_SIZE],
+                    iv=iv,
+                    tag=sealed[-GCM_TAG_SIZE:],
+                    key_id=key_id,
+                    algorithm=dek.algorithm,
+                    timestamp=timestamp
+                ))
+            
+            # 작업 로그 (배치당 1건)
+            await self.log_crypto_operation("encrypt_batch", key_id, total_size, None, None, True, item_count=len(items))
+            
+            return results
+        
+        except Exception as e:
+            await self.log_crypto_operation("encrypt_batch", key_id or "unknown", total_size, None, None, False, str(e), item_count=len(items))
+            logger.error(f"❌ 데이터 일괄 암호화 실패: {str(e)}")
+            raise
+
+    async def decrypt_many(self, items: List[EncryptedData]) -> List[bytes]:
+        """데이터 일괄 복호화 (키 ID별 조회/복호화 1회)"""
+        aeads: Dict[str, AESGCM] = {}
+        stats: Dict[str, List[int]] = {}
+        try:
+            results = []
+            for encrypted_data in items:
+                aead = aeads.get(encrypted_data.key_id)
+                if aead is None:
+                    dek = await self.get_key_by_id(encrypted_data.key_id)
+                    if not dek:
+                        raise ValueError(f"Decryption key not found: {encrypted_data.key_id}")
+                    aead = aeads[encrypted_data.key_id] = await self._get_aead(dek)
+                    stats[encrypted_data.key_id] = [0, 0]
+                
+                plaintext = aead.decrypt(encrypted_data.iv, encrypted_data.ciphertext + encrypted_data.tag, None)
+                stats[encrypted_data.key_id][0] += len(plaintext)
+                stats[encrypted_data.key_id][1] += 1
+                results.append(plaintext)
+            
+            # 작업 로그 (키 ID별 1건)
+            for key_id, (total_size, count) in stats.items():
+                await self.log_crypto_operation("decrypt_batch", key_id, total_size, None, None, True, item_count=count)
+            
+            return results
+        
+        except Exception as e:
+            key_id = items[len(results)].key_id if len(results) < len(items) else "unknown"
+            await self.log_crypto_operation("decrypt_batch", key_id, 0, None, None, False, str(e), item_count=len(items))
+            logger.error(f"❌ 데이터 일괄 복호화 실패: {str(e)}")
+            raise
+
     async def sign_data(self, data: bytes, key_id: Optional[str] = None) -> DigitalSignature:
         """데이터 서명"""
         try:
@@ -506,35 +930,30 @@ class CryptoManager:
             if not signing_key:
                 raise ValueError(f"Signing key not found: {key_id}")
             
-            # 개인키 복호화
-            private_key_bytes = await self.decrypt_with_master_key(
-                signing_key.key_data,
-                signing_key.iv,
-                base64.b64decode(signing_key.metadata.get("tag", "")) if signing_key.metadata and signing_key.metadata.get("tag") else b""
-            )
-            
-            private_key = serialization.load_pem_private_key(
-                private_key_bytes,
-                password=None,
-                backend=default_backend()
-            )
+            # 개인키 복호화 및 역직렬화
+            private_key = await self._load_private_key(signing_key)
             
             # 데이터 서명
-            signature = private_key.sign(
-                data,
-                asym_padding.PSS(
-                    mgf=asym_padding.MGF1(hashes.SHA256()),
-                    salt_length=asym_padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+            if signing_key.algorithm == EncryptionAlgorithm.ED25519:
+                signature = private_key.sign(data)
+                signature_algorithm = "Ed25519"
+            else:
+                signature = private_key.sign(
+                    data,
+                    asym_padding.PSS(
+                        mgf=asym_padding.MGF1(hashes.SHA256()),
+                        salt_length=asym_padding.PSS.MAX_LENGTH
+                    ),
+                    hashes.SHA256()
+                )
+                signature_algorithm = "RSA-PSS-SHA256"
             
             # 작업 로그
             await self.log_crypto_operation("sign", key_id, len(data), None, None, True)
             
             return DigitalSignature(
                 signature=signature,
-                algorithm="RSA-PSS-SHA256",
+                algorithm=signature_algorithm,
                 key_id=key_id,
                 timestamp=datetime.utcnow()
             )
@@ -553,22 +972,21 @@ class CryptoManager:
                 raise ValueError(f"Signing key not found: {signature.key_id}")
             
             # 공개키 추출
-            public_key_bytes = base64.b64decode(signing_key.metadata.get("public_key", ""))
-            public_key = serialization.load_pem_public_key(
-                public_key_bytes,
-                backend=default_backend()
-            )
+            public_key = self._load_public_key(signing_key)
             
             # 서명 검증
-            public_key.verify(
-                signature.signature,
-                data,
-                asym_padding.PSS(
-                    mgf=asym_padding.MGF1(hashes.SHA256()),
-                    salt_length=asym_padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+            if signing_key.algorithm == EncryptionAlgorithm.ED25519:
+                public_key.verify(signature.signature, data)
+            else:
+                public_key.verify(
+                    signature.signature,
+                    data,
+                    asym_padding.PSS(
+                        mgf=asym_padding.MGF1(hashes.SHA256()),
+                        salt_length=asym_padding.PSS.MAX_LENGTH
+                    ),
+                    hashes.SHA256()
+                )
             
             # 작업 로그
             await self.log_crypto_operation("verify", signature.key_id, len(data), None, None, True)
@@ -580,6 +998,61 @@ class CryptoManager:
             logger.error(f"❌ 서명 검증 실패: {str(e)}")
             return False
 
+    async def mac_data(self, data: bytes, key_id: Optional[str] = None) -> DigitalSignature:
+        """HMAC-SHA256 메시지 인증 코드 생성 (내부 서비스 간 인증용, 외부 공개 서명은 sign_data 사용)"""
+        try:
+            # 기본 MAC 키 사용
+            if not key_id:
+                mac_key = await self.get_key_by_type(KeyType.MAC_KEY)
+                if not mac_key:
+                    key_id = await self.generate_mac_key()
+                    mac_key = await self.get_key_by_id(key_id)
+                else:
+                    key_id = mac_key.key_id
+            else:
+                mac_key = await self.get_key_by_id(key_id)
+            
+            if not mac_key or mac_key.key_type != KeyType.MAC_KEY:
+                raise ValueError(f"MAC key not found: {key_id}")
+            
+            mac = hmac.new(await self._unwrap_key(mac_key), data, hashlib.sha256).digest()
+            
+            # 작업 로그
+            await self.log_crypto_operation("mac", key_id, len(data), None, None, True)
+            
+            return DigitalSignature(
+                signature=mac,
+                algorithm="HMAC-SHA256",
+                key_id=key_id,
+                timestamp=datetime.utcnow()
+            )
+        
+        except Exception as e:
+            await self.log_crypto_operation("mac", key_id or "unknown", len(data) if data else 0, None, None, False, str(e))
+            logger.error(f"❌ 메시지 인증 코드 생성 실패: {str(e)}")
+            raise
+
+    async def verify_mac(self, data: bytes, mac: DigitalSignature) -> bool:
+        """HMAC-SHA256 메시지 인증 코드 검증 (상수 시간 비교)"""
+        try:
+            mac_key = await self.get_key_by_id(mac.key_id)
+            if not mac_key or mac_key.key_type != KeyType.MAC_KEY:
+                raise ValueError(f"MAC key not found: {mac.key_id}")
+            
+            expected = hmac.new(await self._unwrap_key(mac_key), data, hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, mac.signature):
+                raise ValueError("MAC mismatch")
+            
+            # 작업 로그
+            await self.log_crypto_operation("verify_mac", mac.key_id, len(data), None, None, True)
+            
+            return True
+        
+        except Exception as e:
+            await self.log_crypto_operation("verify_mac", mac.key_id, len(data) if data else 0, None, None, False, str(e))
+            logger.error(f"❌ 메시지 인증 코드 검증 실패: {str(e)}")
+            return False
+
     async def rotate_key(self, key_id: str) -> str:
         """키 순환"""
         try:
@@ -594,7 +1067,9 @@ class CryptoManager:
             elif old_key.key_type == KeyType.KEY_ENCRYPTION_KEY:
                 new_key_id = await self.generate_key_encryption_key()
             elif old_key.key_type == KeyType.SIGNING_KEY:
-                new_key_id = await self.generate_signing_key()
+                new_key_id = await self.generate_signing_key(old_key.algorithm)
+            elif old_key.key_type == KeyType.MAC_KEY:
+                new_key_id = await self.generate_mac_key()
             else:
                 raise ValueError(f"Unsupported key type for rotation: {old_key.key_type}")
             
@@ -613,20 +1088,15 @@ class CryptoManager:
 
     async def store_key(self, crypto_key: CryptoKey):
         """키 저장"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+        conn = self.get_connection()
         
         try:
             with conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO security.crypto_keys 
-                    (key_id, key_type, algorithm, key_data, iv, status, expires_at, rotated_from, metadata)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    (key_id, key_type, algorithm, key_data, iv, status, expires_at, rotated_from, metadata,
+                     wrap_tag, public_key)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """, (
                     crypto_key.key_id,
                     crypto_key.key_type.value,
@@ -636,7 +1106,9 @@ class CryptoManager:
                     crypto_key.status.value,
                     crypto_key.expires_at,
                     crypto_key.rotated_from,
-                    json.dumps(crypto_key.metadata) if crypto_key.metadata else None
+                    orjson.dumps(crypto_key.metadata).decode() if crypto_key.metadata else None,
+                    crypto_key.wrap_tag,
+                    crypto_key.public_key
                 ))
                 
             conn.commit()
@@ -646,145 +1118,88 @@ class CryptoManager:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self.return_connection(conn)
+
+    def _row_to_key(self, row: Dict) -> CryptoKey:
+        """DB 행을 CryptoKey로 변환"""
+        # psycopg2는 JSONB를 dict로 디코딩하므로 문자열일 때만 파싱
+        metadata = row['metadata']
+        if isinstance(metadata, (str, bytes)):
+            metadata = orjson.loads(metadata)
+        # 컬럼 도입 이전 키는 메타데이터의 base64 값을 조회 시 한 번만 변환
+        legacy = metadata or {}
+        
+        return CryptoKey(
+            id=row['id'],
+            key_id=row['key_id'],
+            key_type=KeyType(row['key_type']),
+            algorithm=EncryptionAlgorithm(row['algorithm']),
+            key_data=bytes(row['key_data']),
+            iv=bytes(row['iv']) if row['iv'] else None,
+            status=KeyStatus(row['status']),
+            created_at=row['created_at'],
+            expires_at=row['expires_at'],
+            rotated_from=row['rotated_from'],
+            metadata=metadata,
+            wrap_tag=bytes(row['wrap_tag']) if row['wrap_tag'] else (
+                base64.b64decode(legacy['tag']) if legacy.get('tag') else None
+            ),
+            public_key=bytes(row['public_key']) if row['public_key'] else (
+                base64.b64decode(legacy['public_key']) if legacy.get('public_key') else None
+            )
+        )
 
     async def get_key_by_id(self, key_id: str) -> Optional[CryptoKey]:
         """키 ID로 키 조회"""
         # 캐시 확인
-        if key_id in self._key_cache:
-            return self._key_cache[key_id]
-        
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            cursor_factory=RealDictCursor
-        )
+        cached = self._key_cache.get(key_id)
+        if cached:
+            return cached
         
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT * FROM security.crypto_keys 
-                    WHERE key_id = %s AND status = 'active'
-                """, (key_id,))
-                
-                row = cursor.fetchone()
-                
+            row = await self._run_db('select_key_by_id', (key_id,), fetch=True)
             if not row:
                 return None
             
-            crypto_key = CryptoKey(
-                id=row['id'],
-                key_id=row['key_id'],
-                key_type=KeyType(row['key_type']),
-                algorithm=EncryptionAlgorithm(row['algorithm']),
-                key_data=bytes(row['key_data']),
-                iv=bytes(row['iv']) if row['iv'] else None,
-                status=KeyStatus(row['status']),
-                created_at=row['created_at'],
-                expires_at=row['expires_at'],
-                rotated_from=row['rotated_from'],
-                metadata=json.loads(row['metadata']) if row['metadata'] else None
-            )
+            crypto_key = self._row_to_key(row)
             
             # 캐시 저장
-            self._key_cache[key_id] = crypto_key
+            self._key_cache.set(key_id, crypto_key)
             
             return crypto_key
             
         except Exception as e:
             logger.error(f"❌ 키 조회 실패: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     async def get_key_by_type(self, key_type: KeyType) -> Optional[CryptoKey]:
         """키 타입으로 키 조회"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            cursor_factory=RealDictCursor
-        )
-        
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT * FROM security.crypto_keys 
-                    WHERE key_type = %s AND status = 'active'
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """, (key_type.value,))
-                
-                row = cursor.fetchone()
-                
+            row = await self._run_db('select_key_by_type', (key_type.value,), fetch=True)
             if not row:
                 return None
             
-            return CryptoKey(
-                id=row['id'],
-                key_id=row['key_id'],
-                key_type=KeyType(row['key_type']),
-                algorithm=EncryptionAlgorithm(row['algorithm']),
-                key_data=bytes(row['key_data']),
-                iv=bytes(row['iv']) if row['iv'] else None,
-                status=KeyStatus(row['status']),
-                created_at=row['created_at'],
-                expires_at=row['expires_at'],
-                rotated_from=row['rotated_from'],
-                metadata=json.loads(row['metadata']) if row['metadata'] else None
-            )
+            return self._row_to_key(row)
             
         except Exception as e:
             logger.error(f"❌ 키 타입별 조회 실패: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     async def update_key_status(self, key_id: str, status: KeyStatus):
         """키 상태 업데이트"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
-        
         try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    UPDATE security.crypto_keys 
-                    SET status = %s 
-                    WHERE key_id = %s
-                """, (status.value, key_id))
-                
-            conn.commit()
+            await self._run_db('update_key_status', (status.value, key_id))
             
             # 캐시 무효화
-            if key_id in self._key_cache:
-                del self._key_cache[key_id]
+            self._invalidate_key(key_id)
                 
         except Exception as e:
             logger.error(f"❌ 키 상태 업데이트 실패: {str(e)}")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def update_key_metadata(self, key_id: str, metadata: Dict):
         """키 메타데이터 업데이트"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+        conn = self.get_connection()
         
         try:
             with conn.cursor() as cursor:
@@ -792,103 +1207,137 @@ class CryptoManager:
                     UPDATE security.crypto_keys 
                     SET metadata = %s 
                     WHERE key_id = %s
-                """, (json.dumps(metadata), key_id))
+                """, (orjson.dumps(metadata).decode(), key_id))
                 
             conn.commit()
             
             # 캐시 무효화
-            if key_id in self._key_cache:
-                del self._key_cache[key_id]
+            self._invalidate_key(key_id)
                 
         except Exception as e:
             logger.error(f"❌ 키 메타데이터 업데이트 실패: {str(e)}")
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self.return_connection(conn)
 
     async def log_crypto_operation(self, operation_type: str, key_id: str, data_size: int, 
                                  user_id: Optional[int], ip_address: Optional[str], 
-                                 success: bool, error_message: Optional[str] = None):
-        """암호화 작업 로깅"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+                                 success: bool, error_message: Optional[str] = None,
+                                 item_count: int = 1):
+        """암호화 작업 로깅 (배치 저장 대기열에 추가)"""
+        try:
+            self._log_queue.put_nowait((operation_type, key_id, data_size, user_id, ip_address, success, error_message, item_count))
+        except asyncio.QueueFull:
+            self.dropped_logs += 1
+
+    def _copy_logs(self, rows: List[tuple]):
+        """암호화 작업 로그 COPY (스레드풀에서 호출)"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
         
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO security.crypto_operations 
-                    (operation_type, key_id, data_size, user_id, ip_address, success, error_message)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (operation_type, key_id, data_size, user_id, ip_address, success, error_message))
-                
+                cursor.copy_expert("""
+                    COPY security.crypto_operations
+                    (operation_type, key_id, data_size, user_id, ip_address, success, error_message, item_count)
+                    FROM STDIN WITH (FORMAT csv)
+                """, buffer)
             conn.commit()
-            
-        except Exception as e:
-            logger.error(f"❌ 암호화 작업 로깅 실패: {str(e)}")
+        except Exception:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            self.return_connection(conn)
 
-    async def cleanup_expired_keys(self):
-        """만료된 키 정리"""
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-            database=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD
-        )
+    async def _flush_logs(self, rows: List[tuple]):
+        """암호화 작업 로그 배치 저장"""
+        try:
+            await asyncio.get_running_loop().run_in_executor(self.executor, self._copy_logs, rows)
+        except Exception as e:
+            logger.error(f"❌ 암호화 작업 로깅 실패 ({len(rows)}건): {str(e)}")
+
+    async def _log_flusher(self):
+        """암호화 작업 로그 배치 저장 루프 (최대 CRYPTO_LOG_FLUSH_INTERVAL 간격)"""
+        while True:
+            batch = [await self._log_queue.get()]
+            if self._log_queue.qsize() < CRYPTO_LOG_BATCH_SIZE:
+                await asyncio.sleep(CRYPTO_LOG_FLUSH_INTERVAL)
+            
+            while len(batch) < CRYPTO_LOG_BATCH_SIZE and not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            
+            await self._flush_logs(batch)
+
+    def _expire_keys(self) -> List[str]:
+        """만료된 키 일괄 상태 변경 후 키 ID 반환 (스레드풀에서 호출)"""
+        conn = self.get_connection()
         
         try:
             with conn.cursor() as cursor:
                 cursor.execute("""
                     UPDATE security.crypto_keys 
                     SET status = 'expired' 
-                    WHERE expires_at < CURRENT_TIMESTAMP AND status = 'active'
+                    WHERE status = 'active' AND expires_at < CURRENT_TIMESTAMP
+                    RETURNING key_id
                 """)
                 
-                expired_count = cursor.rowcount
+                expired_ids = [row[0] for row in cursor.fetchall()]
                 
             conn.commit()
+            return expired_ids
             
-            if expired_count > 0:
-                logger.info(f"✅ 만료된 키 {expired_count}개 정리 완료")
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
+    async def cleanup_expired_keys(self):
+        """만료된 키 정리"""
+        try:
+            expired_ids = await asyncio.get_running_loop().run_in_executor(self.executor, self._expire_keys)
+            
+            # 만료된 키가 캐시에서 계속 사용되지 않도록 무효화
+            for key_id in expired_ids:
+                self._invalidate_key(key_id)
+            
+            if expired_ids:
+                logger.info(f"✅ 만료된 키 {len(expired_ids)}개 정리 완료")
                 
         except Exception as e:
             logger.error(f"❌ 만료된 키 정리 실패: {str(e)}")
-            conn.rollback()
-        finally:
-            conn.close()
 
 async def main():
     """테스트 실행"""
     crypto_manager = CryptoManager()
     await crypto_manager.initialize()
     
-    # 테스트 데이터 암호화/복호화
-    test_data = b"HankookTire SmartSensor 2.0 - Sensitive Data"
-    logger.info(f"원본 데이터: {test_data}")
-    
-    # 암호화
-    encrypted = await crypto_manager.encrypt_data(test_data)
-    logger.info(f"암호화 완료: {len(encrypted.ciphertext)} bytes")
-    
-    # 복호화
-    decrypted = await crypto_manager.decrypt_data(encrypted)
-    logger.info(f"복호화 완료: {decrypted}")
-    
-    # 서명
-    signature = await crypto_manager.sign_data(test_data)
-    logger.info(f"서명 완료: {len(signature.signature)} bytes")
-    
-    # 서명 검증
-    is_valid = await crypto_manager.verify_signature(test_data, signature)
-    logger.info(f"서명 검증: {is_valid}")
+    try:
+        # 테스트 데이터 암호화/복호화
+        test_data = b"HankookTire SmartSensor 2.0 - Sensitive Data"
+        logger.info(f"원본 데이터: {test_data}")
+        
+        # 암호화
+        encrypted = await crypto_manager.encrypt_data(test_data)
+        logger.info(f"암호화 완료: {len(encrypted.ciphertext)} bytes")
+        
+        # 복호화
+        decrypted = await crypto_manager.decrypt_data(encrypted)
+        logger.info(f"복호화 완료: {decrypted}")
+        
+        # 서명
+        signature = await crypto_manager.sign_data(test_data)
+        logger.info(f"서명 완료: {len(signature.signature)} bytes")
+        
+        # 서명 검증
+        is_valid = await crypto_manager.verify_signature(test_data, signature)
+        logger.info(f"서명 검증: {is_valid}")
+    finally:
+        # 대기 중인 작업 로그 저장 후 정리
+        await crypto_manager.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file